@@ -13,3 +13,19 @@
 # from . import config
 
 # For now, keeping it simple. Scenarios will import directly from modules.
+
+# Library logging setup. A NullHandler keeps the package silent unless the application
+# configures logging; records below LOG_LEVEL are rejected by the level check before any
+# LogRecord is built. LOG_TO_FILE additionally attaches a file handler.
+import logging as _logging
+
+from . import config as _core_config
+
+_package_logger = _logging.getLogger(__name__)
+_package_logger.setLevel(_core_config.LOG_LEVEL)
+if _core_config.LOG_TO_FILE:
+    _file_handler = _logging.FileHandler(_core_config.LOG_FILE_PATH)
+    _file_handler.setFormatter(_logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    _package_logger.addHandler(_file_handler)
+else:
+    _package_logger.addHandler(_logging.NullHandler())
@@ -46,30 +46,36 @@ class AccountManager:
                 break
             try:
                 print(f"INFO: Loading keys from: {file_path}")
-                key_data_frame = pd.read_csv(file_path)
-                for _, row_data in key_data_frame.iterrows():
-                    if loaded_count >= limit:
-                        break
-
-                    if 'pub_key' not in row_data or 'priv_key' not in row_data:
-                        print(f"WARN: Skipping row in {file_path} due to missing 'pub_key' or 'priv_key'. Row: {row_data}")
-                        continue
-
-                    try:
-                        address_str = Web3.to_checksum_address(row_data['pub_key'])
-                        private_key_str = row_data['priv_key']
-                        if not (len(private_key_str) == 64 or (private_key_str.startswith('0x') and len(private_key_str) == 66)):
-                            print(f"WARN: Skipping row in {file_path} due to potentially invalid private key format for {address_str}.")
-                            continue
-                    except Exception as e:
-                        print(f"WARN: Skipping row in {file_path} due to address/key validation error: {e}. Row: {row_data}")
-                        continue
-
-                    if address_str not in self.key_storage:
-                        self.key_storage[address_str] = private_key_str
-                        self.account_addresses.append(address_str)
-                        self.address_to_internal_index[address_str] = loaded_count
-                        loaded_count += 1
+                # Read in chunks of at most `limit` rows so a large key file is only parsed
+                # as far as needed, and walk the two key columns directly instead of
+                # materializing a Series per row with iterrows().
+                with pd.read_csv(file_path, dtype=str, chunksize=limit) as key_chunks:
+                    for key_data_frame in key_chunks:
+                        if 'pub_key' not in key_data_frame.columns or 'priv_key' not in key_data_frame.columns:
+                            print(f"WARN: Skipping {file_path} due to missing 'pub_key' or 'priv_key' column.")
+                            break
+
+                        for pub_key, private_key_str in zip(key_data_frame['pub_key'], key_data_frame['priv_key']):
+                            if loaded_count >= limit:
+                                break
+
+                            try:
+                                address_str = Web3.to_checksum_address(pub_key)
+                                if not (len(private_key_str) == 64 or (private_key_str.startswith('0x') and len(private_key_str) == 66)):
+                                    print(f"WARN: Skipping row in {file_path} due to potentially invalid private key format for {address_str}.")
+                                    continue
+                            except Exception as e:
+                                print(f"WARN: Skipping row in {file_path} due to address/key validation error: {e}. Row: {pub_key}")
+                                continue
+
+                            if address_str not in self.key_storage:
+                                self.key_storage[address_str] = private_key_str
+                                self.account_addresses.append(address_str)
+                                self.address_to_internal_index[address_str] = loaded_count
+                                loaded_count += 1
+
+                        if loaded_count >= limit:
+                            break
             except FileNotFoundError:
                 print(f"WARN: Key file not found: {file_path}")
             except pd.errors.EmptyDataError:
@@ -122,6 +128,14 @@ class AccountManager:
         effective_nonce_val = nonce_val if nonce_val is not None else core_config.DEFAULT_INITIAL_NONCE
         self._initialize_all_fuzzer_nonces(effective_nonce_val)
 
+    def snapshot_fuzzer_nonces(self) -> Dict[str, int]:
+        """Returns a copy of all fuzzer-managed nonces, to be passed to `restore_fuzzer_nonces` later."""
+        return dict(self.fuzzer_nonces)
+
+    def restore_fuzzer_nonces(self, nonces: Dict[str, int]):
+        """Replaces all fuzzer-managed nonces with those from a `snapshot_fuzzer_nonces` result."""
+        self.fuzzer_nonces = dict(nonces)
+
     def get_account_by_index(self, index: int) -> Optional[str]:
         """Gets an account address by its internal load order index."""
         if 0 <= index < len(self.account_addresses):
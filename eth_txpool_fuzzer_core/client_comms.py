@@ -33,6 +33,10 @@ class EthereumClient:
         self.rpc_url = rpc_url
         self.w3 = Web3(Web3.HTTPProvider(rpc_url))
         self.chain_id = chain_id
+        # Keep-alive session for custom JSON-RPC calls, so the fuzz loop reuses one TCP
+        # connection instead of opening a new one per request.
+        self._rpc_session = requests.Session()
+        self._rpc_session.headers.update({"Content-Type": "application/json"})
 
         if not self.w3.is_connected():
             print(f"CRITICAL: Failed to connect to Ethereum client at {rpc_url}. Ensure the client is running and accessible.")
@@ -88,7 +92,7 @@ class EthereumClient:
             "id": 1,
         }
         try:
-            response = requests.post(self.rpc_url, json=payload, headers={"Content-Type": "application/json"})
+            response = self._rpc_session.post(self.rpc_url, json=payload)
             response.raise_for_status()
             json_response = response.json()
             if 'error' in json_response:
@@ -1,7 +1,9 @@
 import abc
 import subprocess
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from web3 import Web3
+from eth_txpool_fuzzer_core import config as core_config
 from eth_txpool_fuzzer_core.tx import FuzzTx # Assuming FuzzTx is in eth_txpool_fuzzer_core/tx.py
 
 class IEthereumClient(abc.ABC):
@@ -31,6 +33,10 @@ class IEthereumClient(abc.ABC):
         self.w3: Optional[Web3] = None
         self._process: Optional[subprocess.Popen] = None # For managed clients
         self._client_kwargs = kwargs # Store client-specific kwargs
+        self._resolved_chain_id: Optional[int] = None # Cached by get_chain_id()
+        self._transfer_template: Optional[Dict[str, Any]] = None # Cached by _get_transfer_template()
+        self._signed_tx_cache: Dict[Tuple[Any, ...], bytes] = {} # Filled by _sign_transaction()
+        self._gas_price_cache: Tuple[float, Optional[Dict[str, int]]] = (0.0, None) # (fetch time, gas prices)
 
     @abc.abstractmethod
     def start(self) -> None:
@@ -79,10 +85,108 @@ class IEthereumClient(abc.ABC):
             # self.w3.middleware_onion.inject(geth_poa_middleware, layer=0)
         return self.w3
 
-    @abc.abstractmethod
+    def get_chain_id(self) -> int:
+        """
+        Returns the chain ID used when signing transactions.
+        Uses the configured `chain_id` if the concrete client has one, otherwise queries the
+        client once. The chain ID is fixed for a fuzzing campaign, so the result is cached
+        instead of costing an `eth_chainId` round trip for every signed transaction.
+        """
+        if self._resolved_chain_id is None:
+            configured_chain_id = getattr(self, 'chain_id', None)
+            if configured_chain_id is not None:
+                self._resolved_chain_id = configured_chain_id
+            else:
+                self._resolved_chain_id = self.get_web3_instance().eth.chain_id
+        return self._resolved_chain_id
+
+    def _get_transfer_template(self) -> Dict[str, Any]:
+        """
+        Returns the transaction fields that are identical for every transfer this client signs
+        (recipient, gas limit and chain ID). Built once; callers copy it into each transaction.
+        """
+        if self._transfer_template is None:
+            self._transfer_template = {
+                'to': self._client_kwargs.get('default_recipient_address', '0x0000000000000000000000000000000000000000'),
+                'gas': core_config.DEFAULT_GAS_LIMIT, # Standard gas limit for simple transfer
+                'chainId': self.get_chain_id()
+            }
+        return self._transfer_template
+
+    def _build_transaction(self, tx: FuzzTx) -> Dict[str, Any]:
+        """
+        Builds the unsigned transaction dictionary for `tx`, based on its tx_type.
+        """
+        transaction = {
+            **self._get_transfer_template(), # Recipient, gas limit and chain ID
+            'from': tx.sender_address,
+            'value': tx.value,
+            'nonce': tx.nonce
+        }
+
+        if tx.tx_type == 2: # EIP-1559
+            transaction['maxFeePerGas'] = tx.price
+            transaction['maxPriorityFeePerGas'] = tx.max_priority_fee_per_gas
+        elif tx.tx_type == 3: # EIP-4844 (Blob transaction)
+            transaction['maxFeePerGas'] = tx.price
+            transaction['maxPriorityFeePerGas'] = tx.max_priority_fee_per_gas
+            transaction['maxFeePerBlobGas'] = tx.max_fee_per_blob_gas
+            transaction['blobVersionedHashes'] = [h.hex() for h in tx.blob_versioned_hashes] if tx.blob_versioned_hashes else []
+            transaction['type'] = '0x03' # EIP-4844 type
+        else: # Legacy or EIP-2930 (type 0 or 1)
+            transaction['gasPrice'] = tx.price
+            if tx.tx_type == 1:
+                transaction['type'] = '0x01' # EIP-2930 type
+            else:
+                transaction['type'] = '0x00' # Legacy type
+
+        # Remove None values from transaction dict
+        return {k: v for k, v in transaction.items() if v is not None}
+
+    def _sign_transaction(self, tx: FuzzTx, private_key: str) -> bytes:
+        """
+        Signs `tx` and returns the raw signed transaction.
+        The result depends only on the transaction fields and the key, so signatures are cached
+        (up to `SIGNED_TX_CACHE_SIZE`): the normal/future txs that rebuild a base state after each
+        reset are identical across iterations while gas prices are unchanged.
+        """
+        cache_key = (private_key, tx.sender_address, tx.tx_type, tx.nonce, tx.price, tx.value,
+                     tx.max_priority_fee_per_gas, tx.max_fee_per_blob_gas,
+                     tuple(tx.blob_versioned_hashes) if tx.blob_versioned_hashes else None)
+        raw_transaction = self._signed_tx_cache.get(cache_key)
+        if raw_transaction is None:
+            w3 = self.get_web3_instance()
+            raw_transaction = w3.eth.account.sign_transaction(self._build_transaction(tx), private_key).raw_transaction
+            if len(self._signed_tx_cache) >= core_config.SIGNED_TX_CACHE_SIZE:
+                del self._signed_tx_cache[next(iter(self._signed_tx_cache))] # Evict the oldest entry
+            self._signed_tx_cache[cache_key] = raw_transaction
+        return raw_transaction
+
     def get_current_gas_prices(self) -> Dict[str, int]:
         """
-        Fetches the current gas prices from the client.
+        Returns the current gas prices from the client.
+        Returns a dictionary with keys like 'maxFeePerGas', 'maxPriorityFeePerGas', 'gasPrice', 'maxFeePerBlobGas'.
+        A fetch is re-used for up to `GAS_PRICE_CACHE_TTL_SECONDS`, so every mutation strategy
+        working on the same pool shares one set of RPCs. Resets and reverts drop the cached prices.
+        The returned dictionary is shared and must not be modified.
+        """
+        fetched_at, gas_prices = self._gas_price_cache
+        now = time.monotonic()
+        if gas_prices is None or now - fetched_at >= core_config.GAS_PRICE_CACHE_TTL_SECONDS:
+            gas_prices = self._fetch_current_gas_prices()
+            self._gas_price_cache = (now, gas_prices)
+        return gas_prices
+
+    def _invalidate_gas_price_cache(self) -> None:
+        """
+        Drops the cached gas prices; called whenever the chain state is rolled back.
+        """
+        self._gas_price_cache = (0.0, None)
+
+    @abc.abstractmethod
+    def _fetch_current_gas_prices(self) -> Dict[str, int]:
+        """
+        Fetches the current gas prices from the client, bypassing the cache.
         Returns a dictionary with keys like 'maxFeePerGas', 'maxPriorityFeePerGas', 'gasPrice', 'maxFeePerBlobGas'.
         """
         pass
@@ -95,6 +199,53 @@ class IEthereumClient(abc.ABC):
         """
         pass
 
+    def sign_and_send_transfer_batch(self, txs: List[FuzzTx], private_keys: List[str]) -> List[Optional[str]]:
+        """
+        Signs transactions locally and submits them in a single JSON-RPC batch request
+        (one `eth_sendRawTransaction` entry per transaction), instead of one round trip each.
+        Entries are submitted in the given order, but JSON-RPC 2.0 lets the node process them in
+        any order (Anvil handles them concurrently), so only transactions whose arrival order does
+        not matter should share a batch. Unlike `sign_and_send_transfer`, this does not wait for receipts.
+
+        Args:
+            txs: The transactions to send.
+            private_keys: The sender's private key for each transaction in `txs`.
+        Returns:
+            The transaction hash for each transaction, or None where signing or submission failed.
+        """
+        w3 = self.get_web3_instance()
+        tx_hashes: List[Optional[str]] = [None] * len(txs)
+        batch_positions: List[int] = []
+        batch_requests: List[Any] = []
+        for position, (tx, private_key) in enumerate(zip(txs, private_keys)):
+            try:
+                raw_transaction = self._sign_transaction(tx, private_key)
+            except Exception as e:
+                print(f"ERROR: Failed to sign transaction from {tx.sender_address} (Nonce: {tx.nonce}): {e}")
+                continue
+            batch_positions.append(position)
+            batch_requests.append(("eth_sendRawTransaction", [w3.to_hex(raw_transaction)]))
+
+        if not batch_requests:
+            return tx_hashes
+
+        try:
+            responses = w3.provider.make_batch_request(batch_requests)
+        except Exception as e:
+            print(f"ERROR: Failed to send transaction batch: {e}")
+            return tx_hashes
+        if not isinstance(responses, list):
+            # The whole batch was rejected with a single error response
+            print(f"ERROR: Transaction batch rejected: {responses.get('error', responses)}")
+            return tx_hashes
+
+        for position, response in zip(batch_positions, responses):
+            if 'result' in response:
+                tx_hashes[position] = response['result']
+            else:
+                print(f"ERROR: Failed to send transaction from {txs[position].sender_address}: {response.get('error')}")
+        return tx_hashes
+
     @abc.abstractmethod
     def get_txpool_content(self) -> Dict[str, Any]:
         """
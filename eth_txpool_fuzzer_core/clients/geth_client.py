@@ -147,6 +147,7 @@ class GethClient(IEthereumClient):
         Resets the Geth blockchain state.
         Geth supports `debug_resetChain` on dev chains. If not, a full restart might be needed.
         """
+        self._invalidate_gas_price_cache()
         w3 = self.get_web3_instance()
         method = self.rpc_method_aliases.get("reset_state")
         if method:
@@ -184,7 +185,7 @@ class GethClient(IEthereumClient):
         raise NotImplementedError("GethClient does not support direct account funding via RPC. "
                                   "Accounts must be pre-funded or funded via transactions from a known account.")
 
-    def get_current_gas_prices(self) -> Dict[str, int]:
+    def _fetch_current_gas_prices(self) -> Dict[str, int]:
         """
         Fetches current gas prices from Geth.
         """
@@ -231,40 +232,9 @@ class GethClient(IEthereumClient):
         Signs and sends a transaction to Geth.
         """
         w3 = self.get_web3_instance()
-        account = w3.eth.account.from_key(private_key)
-
-        # Build transaction dictionary based on tx_type
-        transaction = {
-            'from': tx.sender_address,
-            'to': self._client_kwargs.get('default_recipient_address', '0x0000000000000000000000000000000000000000'),
-            'value': tx.value,
-            'nonce': tx.nonce,
-            'gas': 21000, # Standard gas limit for simple transfer
-            'chainId': self.chain_id if self.chain_id is not None else w3.eth.chain_id
-        }
-
-        if tx.tx_type == 2: # EIP-1559
-            transaction['maxFeePerGas'] = tx.price
-            transaction['maxPriorityFeePerGas'] = tx.max_priority_fee_per_gas
-        elif tx.tx_type == 3: # EIP-4844 (Blob transaction)
-            transaction['maxFeePerGas'] = tx.price
-            transaction['maxPriorityFeePerGas'] = tx.max_priority_fee_per_gas
-            transaction['maxFeePerBlobGas'] = tx.max_fee_per_blob_gas
-            transaction['blobVersionedHashes'] = [h.hex() for h in tx.blob_versioned_hashes] if tx.blob_versioned_hashes else []
-            transaction['type'] = '0x03' # EIP-4844 type
-        else: # Legacy or EIP-2930 (type 0 or 1)
-            transaction['gasPrice'] = tx.price
-            if tx.tx_type == 1:
-                transaction['type'] = '0x01' # EIP-2930 type
-            else:
-                transaction['type'] = '0x00' # Legacy type
-
-        # Remove None values from transaction dict
-        transaction = {k: v for k, v in transaction.items() if v is not None}
 
         try:
-            signed_tx = account.sign_transaction(transaction)
-            tx_hash = w3.eth.send_raw_transaction(signed_tx.rawTransaction).hex()
+            tx_hash = w3.to_hex(w3.eth.send_raw_transaction(self._sign_transaction(tx, private_key)))
             # For Geth, waiting for receipt might be necessary for state updates
             w3.eth.wait_for_transaction_receipt(tx_hash, timeout=10)
             return tx_hash
@@ -320,6 +290,7 @@ class GethClient(IEthereumClient):
         Reverts the Geth chain state to a previously created snapshot using `evm_revert` RPC.
         Note: This is typically only available on development chains.
         """
+        self._invalidate_gas_price_cache()
         w3 = self.get_web3_instance()
         try:
             method = self.rpc_method_aliases.get("revert", "evm_revert")
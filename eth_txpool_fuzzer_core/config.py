@@ -2,30 +2,44 @@
 Default configuration values for the Ethereum TxPool Fuzzer Core library.
 These can be overridden by scenario-specific configurations.
 """
+import logging
+from typing import Final
 
-DEFAULT_TARGET_URL: str = "http://127.0.0.1:18546"
-DEFAULT_CHAIN_ID: int = 20191003
-DEFAULT_GAS_LIMIT: int = 21000
+DEFAULT_TARGET_URL: Final[str] = "http://127.0.0.1:18546"
+DEFAULT_CHAIN_ID: Final[int] = 20191003
+DEFAULT_GAS_LIMIT: Final[int] = 21000
 
-DEFAULT_TXPOOL_SIZE: int = 4
-DEFAULT_FUTURE_SLOTS: int = 1
+DEFAULT_TXPOOL_SIZE: Final[int] = 4
+DEFAULT_FUTURE_SLOTS: Final[int] = 1
 
-DEFAULT_KEY_FILE_PRIMARY: str = './key_prive2.csv'
-DEFAULT_KEY_FILE_SECONDARY: str = './key_prive.csv'
-DEFAULT_INITIAL_NONCE: int = 0
-MAX_ACCOUNTS_TO_LOAD: int = 100
+DEFAULT_KEY_FILE_PRIMARY: Final[str] = './key_prive2.csv'
+DEFAULT_KEY_FILE_SECONDARY: Final[str] = './key_prive.csv'
+DEFAULT_INITIAL_NONCE: Final[int] = 0
+MAX_ACCOUNTS_TO_LOAD: Final[int] = 100
 
-STATE_NORMAL_TX_PRICE_INDICATOR: int = 3
-STATE_PARENT_REPLACEMENT_PRICE_THRESHOLD: int = 12000
-STATE_CHILD_VALUE_THRESHOLD: int = 10000
+STATE_NORMAL_TX_PRICE_INDICATOR: Final[int] = 3
+STATE_PARENT_REPLACEMENT_PRICE_THRESHOLD: Final[int] = 12000
+STATE_CHILD_VALUE_THRESHOLD: Final[int] = 10000
 
-DEFAULT_GRAPHVIZ_FILENAME: str = 'txpool_fuzz_graph'
-DEFAULT_GRAPHVIZ_VIEW_ON_COMPLETE: bool = True
+DEFAULT_GRAPHVIZ_FILENAME: Final[str] = 'txpool_fuzz_graph'
+DEFAULT_GRAPHVIZ_VIEW_ON_COMPLETE: Final[bool] = True
 
-DEFAULT_MAX_FUZZ_ITERATIONS: int = 1000
-DEFAULT_TIMEOUT_PER_ITERATION_SECONDS: float = 5.0
-DEFAULT_GLOBAL_FUZZ_TIMEOUT_SECONDS: float = 3600.0
+DEFAULT_MAX_FUZZ_ITERATIONS: Final[int] = 1000
+DEFAULT_TIMEOUT_PER_ITERATION_SECONDS: Final[float] = 5.0
+DEFAULT_GLOBAL_FUZZ_TIMEOUT_SECONDS: Final[float] = 3600.0
+# A seed served this many times is demoted behind every seed that has not been,
+# so one low-energy state cannot monopolize the mutation budget.
+MAX_CONSECUTIVE_MUTATIONS: Final[int] = 8
+# Every SEED_EVICTION_INTERVAL_ITERATIONS iterations, seeds not selected for SEED_MAX_IDLE_SECONDS
+# are evicted (their states stay known, so they are not re-added).
+SEED_EVICTION_INTERVAL_ITERATIONS: Final[int] = 100
+SEED_MAX_IDLE_SECONDS: Final[float] = 600.0
+# Gas prices fetched by the engine and the clients are re-used for this long; the local chain is idle between our submissions.
+GAS_PRICE_CACHE_TTL_SECONDS: Final[float] = 1.0
+# Signed raw transactions kept per client. Base-state txs are re-signed identically after every
+# reset, so most signatures can be re-used instead of recomputed.
+SIGNED_TX_CACHE_SIZE: Final[int] = 4096
 
-LOG_LEVEL: str = "INFO"
-LOG_TO_FILE: bool = False
-LOG_FILE_PATH: str = "fuzzer.log"
+LOG_LEVEL: Final[int] = logging.INFO
+LOG_TO_FILE: Final[bool] = False
+LOG_FILE_PATH: Final[str] = "fuzzer.log"
@@ -85,7 +85,8 @@ class LowCostStateExploit(ExploitCondition):
             child_value_threshold=self.child_val_threshold
         )
 
-        normal_tx_count = symbolic_str.count('N')
+        if 'N' in symbolic_str: # Any 'Normal' tx rules the state out; skip counting the rest
+            return False
 
         parent_tx_count = symbolic_str.count('P') + symbolic_str.count('R')
         child_c_tx_count = symbolic_str.count('C')
@@ -94,9 +95,7 @@ class LowCostStateExploit(ExploitCondition):
 
         cost_threshold = self.cost_limit_factor * self.txpool_size
 
-        if normal_tx_count == 0 and calculated_state_cost <= cost_threshold:
-            return True
-        return False
+        return calculated_state_cost <= cost_threshold
 
 class EpsilonCostExploit(ExploitCondition):
     """
@@ -136,7 +135,9 @@ class EpsilonCostExploit(ExploitCondition):
             child_value_threshold=self.child_val_threshold
         )
 
-        normal_tx_count = symbolic_str.count('N')
+        if 'N' in symbolic_str: # Any 'Normal' tx rules the state out; skip counting the rest
+            return False
+
         parent_p_tx_count = symbolic_str.count('P')
         parent_r_tx_count = symbolic_str.count('R')
         child_c_tx_count = symbolic_str.count('C')
@@ -147,6 +148,4 @@ class EpsilonCostExploit(ExploitCondition):
 
         cost_threshold = self.epsilon * (self.threshold_base_scaling_factor * self.txpool_size)
 
-        if normal_tx_count == 0 and calculated_state_cost <= cost_threshold:
-            return True
-        return False
+        return calculated_state_cost <= cost_threshold
@@ -2,10 +2,10 @@
 Defines exploit conditions specifically for EIP-4844 blob transactions.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 from eth_txpool_fuzzer_core.exploit_detectors import ExploitCondition
-from eth_txpool_fuzzer_core.state import get_symbolic_pool_state, get_total_pending_tx_count
+from eth_txpool_fuzzer_core.state import get_symbolic_pool_state, get_total_pending_tx_count, normalize_txpool, PoolTx
 
 class BlobPoolStallExploit(ExploitCondition):
     """
@@ -69,3 +69,64 @@ class InvalidBlobTxAcceptanceExploit(ExploitCondition):
             print("INFO: InvalidBlobTxAcceptanceExploit triggered: Symbolic state contains 'I' (invalid blob).")
             return True
         return False
+
+class FusedBlobExploitCondition(ExploitCondition):
+    """
+    Detects the same exploits as the blob scenario's composite of PendingEmptyExploit,
+    LowCostStateExploit, BlobPoolStallExploit, BlobGasPriceManipulationExploit and
+    InvalidBlobTxAcceptanceExploit, from one symbolization and one walk over the pending txs
+    instead of one pass per detector. The names of the conditions met by the last check are
+    kept in `last_triggered`.
+    """
+    def __init__(self,
+                 txpool_size: int,
+                 low_price_threshold: int = 1,
+                 high_price_threshold: int = 1000
+                ):
+        self.txpool_size = txpool_size
+        self.low_price_threshold = low_price_threshold
+        self.high_price_threshold = high_price_threshold
+        self.last_triggered: Tuple[str, ...] = ()
+
+    def _find_low_blob_gas_price(self, pending_txs: Dict[str, List[PoolTx]]) -> Optional[int]:
+        """Returns the first pending blob tx's maxFeePerBlobGas at or below the low threshold, if any."""
+        for sender_addr, sender_txs in pending_txs.items():
+            for pool_tx in sender_txs:
+                if pool_tx.tx_type is None or (pool_tx.tx_type == 3 and pool_tx.max_fee_per_blob_gas is None):
+                    print(f"WARN: Malformed tx details for blob gas price check on {sender_addr} N:{pool_tx.nonce}.")
+                    continue
+                if pool_tx.tx_type == 3 and pool_tx.max_fee_per_blob_gas <= self.low_price_threshold:
+                    return pool_tx.max_fee_per_blob_gas
+        return None
+
+    def check_condition(self, txpool_content: Dict[str, Any]) -> bool:
+        # The pool size only changes the number of 'E's, which none of the blob checks look at
+        symbolic_state = get_symbolic_pool_state(txpool_content, txpool_size_config=self.txpool_size)
+        pending_txs = normalize_txpool(txpool_content)['pending']
+        pending_tx_count = get_total_pending_tx_count(txpool_content)
+        triggered: List[str] = []
+
+        if pending_tx_count == 0:
+            triggered.append("PendingEmptyExploit")
+
+        # LowCostStateExploit: no 'N's and a parent/child cost within the pool size
+        parent_tx_count = symbolic_state.count('P') + symbolic_state.count('R')
+        state_cost = parent_tx_count * 4 + symbolic_state.count('C') * 100
+        if 'N' not in symbolic_state and state_cost <= self.txpool_size:
+            triggered.append("LowCostStateExploit")
+
+        if ('B' in symbolic_state or 'I' in symbolic_state) and pending_tx_count == 0:
+            print("INFO: BlobPoolStallExploit triggered: Pool contained blobs but pending count is zero.")
+            triggered.append("BlobPoolStallExploit")
+
+        low_blob_gas_price = self._find_low_blob_gas_price(pending_txs)
+        if low_blob_gas_price is not None:
+            print(f"INFO: BlobGasPriceManipulationExploit triggered: Low blob gas price ({low_blob_gas_price}) accepted.")
+            triggered.append("BlobGasPriceManipulationExploit")
+
+        if 'I' in symbolic_state:
+            print("INFO: InvalidBlobTxAcceptanceExploit triggered: Symbolic state contains 'I' (invalid blob).")
+            triggered.append("InvalidBlobTxAcceptanceExploit")
+
+        self.last_triggered = tuple(triggered)
+        return bool(triggered)
@@ -3,9 +3,14 @@ Core fuzzing engine components: Seed, SeedDatabase, and the main FuzzEngine clas
 This module orchestrates the fuzzing process, managing states, inputs, and mutations.
 """
 
+import heapq
+import itertools
+import copy
+import logging
 import sys
 import time
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple
 
 from .tx import FuzzInput, FuzzTx
 from .accounts import AccountManager
@@ -15,6 +20,8 @@ from .exploit_detectors import ExploitCondition
 from .strategies.base_strategy import MutationStrategy
 from . import config as core_config
 
+logger = logging.getLogger(__name__)
+
 class Seed:
     """
     Represents a seed in the fuzzing process. A seed encapsulates an input
@@ -32,18 +39,34 @@ class Seed:
         self.fuzz_input: FuzzInput = fuzz_input
         self.txpool_state: Optional[Dict[str, Any]] = txpool_state
         self.symbolic_state_str: Optional[str] = symbolic_state_str
+        # Normal/future tx counts of this state, needed every time the state is recreated
+        self.normal_count: int = symbolic_state_str.count('N') if symbolic_state_str else 0
+        self.future_count: int = symbolic_state_str.count('F') if symbolic_state_str else 0
         self.energy: int = energy
         self.label_for_graph: str = label_for_graph
         self.generation: int = generation # Tracks how "old" or processed this seed is
+        self.demoted: bool = False # Set once the seed has been served MAX_CONSECUTIVE_MUTATIONS times
+        self.last_selected_time: float = time.monotonic() # Creation or last selection, for age-based eviction
+        self.exploit_found: bool = False # Whether txpool_state met the campaign's exploit condition
+        self._seq: int = next(Seed._seq_counter) # Insertion order, final tie-breaker
+        self._refresh_key()
+
+    _seq_counter = itertools.count()
+
+    def _refresh_key(self):
+        """
+        Recomputes the ordering key. Must be called after changing any field it is built from
+        (`SeedDatabase.get_next_seed` does this when it re-serves a seed).
+        """
+        self._key: Tuple[bool, int, int, int] = (self.demoted, self.energy, self.generation, self._seq)
 
     def __lt__(self, other: 'Seed') -> bool:
         """
-        Comparison method for sorting seeds. Prioritizes lower energy.
-        As a tie-breaker, prefers seeds that have been processed fewer times (lower generation).
+        Comparison method for ordering seeds. Demoted seeds always rank behind the rest;
+        otherwise prioritizes lower energy. As a tie-breaker, prefers seeds that have been
+        processed fewer times (lower generation), then seeds that were (re-)inserted earlier.
         """
-        if self.energy == other.energy:
-            return self.generation < other.generation
-        return self.energy < other.energy
+        return self._key < other._key
 
     def __repr__(self) -> str:
         return (f"Seed(input_tx_count={len(self.fuzz_input.tx_sequence_to_execute)}, "
@@ -54,58 +77,90 @@ class SeedDatabase:
     """
     Manages a collection of `Seed` objects. It prioritizes seeds for exploration
     based on their energy score and tracks known symbolic states to avoid redundant work.
+
+    Invariant: a seed's energy is immutable once it has been added. Only its generation,
+    insertion sequence and demoted flag change, and only by growing, which `get_next_seed`
+    relies on to restore the heap order with at most one sift-down.
     """
     def __init__(self):
-        self.seeds: List[Seed] = []
-        self.known_symbolic_states: set[str] = set() # Stores symbolic state strings
+        self.seeds: List[Seed] = [] # Binary min-heap ordered by Seed.__lt__
+        # 64-bit hashes of known symbolic states; the strings themselves live on the seeds.
+        self.known_symbolic_states: set[int] = set()
+        self._dirty = False # Seeds were appended without restoring the heap order
 
     def add_seed(self, seed: Seed):
         """
         Adds a new seed to the database if its symbolic state is not already known.
-        Maintains the sorted order of seeds by energy.
+        Maintains the heap order of seeds by energy.
         """
-        if seed.symbolic_state_str is None:
-            # TODO: Log warning: "Seed has no symbolic state, cannot track uniqueness."
-            # For now, we'll add it but it won't contribute to `known_symbolic_states`
+        symbolic_state_str = seed.symbolic_state_str
+        if symbolic_state_str is None:
+            # Cannot be tracked for uniqueness; append now and restore the heap order lazily
             self.seeds.append(seed)
-            self.seeds.sort()
+            self._dirty = True
             return
-
-        if seed.symbolic_state_str not in self.known_symbolic_states:
-            self.known_symbolic_states.add(seed.symbolic_state_str)
-            self.seeds.append(seed)
-            self.seeds.sort() # Keep the list sorted by energy
-            # TODO: Log: f"Added new seed. Symbolic state: {seed.symbolic_state_str}, Energy: {seed.energy}"
+        state_key = hash(symbolic_state_str)
+        if state_key in self.known_symbolic_states:
+            return # Already covered (the common case for mutants); nothing else to do
+        self.known_symbolic_states.add(state_key)
+        if self._dirty:
+            self.seeds.append(seed) # Ordered by the pending heapify
         else:
-            # TODO: Log: f"Seed's state {seed.symbolic_state_str} already covered. Not adding."
-            pass
+            heapq.heappush(self.seeds, seed)
 
     def get_next_seed(self) -> Optional[Seed]:
         """
         Retrieves the highest-priority seed (lowest energy, least processed) from the database.
-        The retrieved seed's generation count is incremented, and it's re-sorted.
+        The retrieved seed's generation count is incremented and it is re-inserted into the heap.
         Returns None if the database is empty.
         """
         if not self.seeds:
             return None
+        if self._dirty:
+            heapq.heapify(self.seeds) # One heapify for every seed appended since the last call
+            self._dirty = False
 
-        # The list is always sorted, so the first element is the highest priority
-        next_seed = self.seeds.pop(0) # Remove the best seed
+        # The heap root is the highest priority seed
+        next_seed = self.seeds[0]
 
         next_seed.generation += 1 # Mark it as processed one more time
-        # Re-add it to the list; it will be re-sorted based on its new generation/energy
-        self.seeds.append(next_seed)
-        self.seeds.sort() # Re-sort the list
+        next_seed._seq = next(Seed._seq_counter) # Queue behind seeds with the same energy/generation
+        next_seed.last_selected_time = time.monotonic()
+        if next_seed.generation >= core_config.MAX_CONSECUTIVE_MUTATIONS:
+            next_seed.demoted = True # Let other states be explored before mutating this one further
+        next_seed._refresh_key()
+        # Re-key in place: its key only grew, so the heap is still valid unless one of the root's
+        # children now outranks it, in which case a single sift-down from the root restores it.
+        seeds = self.seeds
+        if (len(seeds) > 1 and seeds[1] < next_seed) or (len(seeds) > 2 and seeds[2] < next_seed):
+            heapq.heapreplace(seeds, next_seed)
 
         return next_seed
 
+    def evict_older_than(self, seconds: float) -> int:
+        """
+        Drops seeds that have already been mutated (generation > 0) but have not been selected
+        for `seconds`. Their symbolic states stay known, so they are not re-added later.
+
+        :param seconds: Maximum idle time of a seed since it was created or last selected.
+        :return: Number of evicted seeds.
+        """
+        cutoff = time.monotonic() - seconds
+        kept = [seed for seed in self.seeds if seed.generation == 0 or seed.last_selected_time >= cutoff]
+        evicted = len(self.seeds) - len(kept)
+        if evicted:
+            heapq.heapify(kept)
+            self.seeds = kept
+            self._dirty = False
+        return evicted
+
     def is_empty(self) -> bool:
         """Checks if the seed database contains any seeds."""
         return not self.seeds
 
     def covers(self, symbolic_state_str: str) -> bool:
         """Checks if a given symbolic state string is already present in the database."""
-        return symbolic_state_str in self.known_symbolic_states
+        return hash(symbolic_state_str) in self.known_symbolic_states
 
     @property
     def count(self) -> int:
@@ -144,7 +199,8 @@ class FuzzEngine:
                  default_recipient_address: Optional[str] = None,
                  max_iterations: int = core_config.DEFAULT_MAX_FUZZ_ITERATIONS,
                  global_timeout_seconds: float = core_config.DEFAULT_GLOBAL_FUZZ_TIMEOUT_SECONDS,
-                 future_flag_enabled: bool = False # Controls if future transactions are generated initially
+                 future_flag_enabled: bool = False, # Controls if future transactions are generated initially
+                 worker_clients: Optional[List[IEthereumClient]] = None # Extra nodes to execute mutated inputs on concurrently
                 ):
         self.account_manager = account_manager
         self.client = ethereum_client
@@ -162,9 +218,19 @@ class FuzzEngine:
         self.seed_db = SeedDatabase()
         self.found_exploits: List[Dict[str, Any]] = []
         self.current_fuzzer_account_index = 0 # Global counter for accounts used by fuzzer for new txs
+        self._snapshots_supported = True # Cleared once the client is found unable to snapshot/revert the pool
+
+        # One engine per extra client, each with its own copy of the account bookkeeping
+        self._worker_engines: List['FuzzEngine'] = []
+        for worker_client in worker_clients or []:
+            worker_engine = copy.copy(self)
+            worker_engine.client = worker_client
+            worker_engine.account_manager = copy.deepcopy(account_manager)
+            worker_engine._worker_engines = []
+            self._worker_engines.append(worker_engine)
 
         if self.default_recipient_address is None:
-            print("CRITICAL: FuzzEngine initialized without a valid default recipient address.")
+            logger.critical("FuzzEngine initialized without a valid default recipient address.")
             # Consider raising an error
 
     def _generate_future_tx(self, current_fuzzer_account_index: int, gas_prices: Dict[str, int]) -> FuzzTx:
@@ -172,7 +238,7 @@ class FuzzEngine:
         acc_addr = self.account_manager.get_account_by_index(current_fuzzer_account_index)
         if acc_addr is None:
             acc_addr = self.account_manager.get_account_by_index(0)
-            print(f"WARN: Fuzzer account index {current_fuzzer_account_index} out of bounds. Using account 0 for future tx.")
+            logger.warning("Fuzzer account index %s out of bounds. Using account 0 for future tx.", current_fuzzer_account_index)
 
         return FuzzTx(
             account_manager_index=current_fuzzer_account_index,
@@ -189,12 +255,12 @@ class FuzzEngine:
         acc_addr = self.account_manager.get_account_by_index(current_fuzzer_account_index)
         if acc_addr is None:
             acc_addr = self.account_manager.get_account_by_index(0)
-            print(f"WARN: Fuzzer account index {current_fuzzer_account_index} out of bounds. Using account 0 for parent tx.")
+            logger.warning("Fuzzer account index %s out of bounds. Using account 0 for parent tx.", current_fuzzer_account_index)
 
         current_nonce = self.account_manager.get_fuzzer_nonce(acc_addr)
         if current_nonce is None:
             current_nonce = 0
-            print(f"WARN: Could not get fuzzer nonce for {acc_addr}. Using 0.")
+            logger.warning("Could not get fuzzer nonce for %s. Using 0.", acc_addr)
 
         value = core_config.DEFAULT_GAS_LIMIT * (12000 - price)
 
@@ -213,17 +279,17 @@ class FuzzEngine:
         Uses dynamic gas prices for initial transactions.
         """
         # Reset the client's state or clear the pool
-        print("INFO: Resetting client state or clearing transaction pool...")
+        logger.info("Resetting client state or clearing transaction pool...")
         try:
             self.client.reset_state()
-            print("INFO: Client state reset via reset_state method.")
+            logger.info("Client state reset via reset_state method.")
         except NotImplementedError:
-            print("WARN: Client does not support direct state reset. Attempting to clear txpool only.")
+            logger.warning("Client does not support direct state reset. Attempting to clear txpool only.")
             # The base client's `clear_txpool_custom` is not part of the IEthereumClient interface.
             # This functionality should be handled by `reset_state` or a specific client method.
             # For now, we'll assume `reset_state` is the primary way to clear the pool.
             # If `reset_state` is not implemented, the client should handle it or raise an error.
-            print("WARN: No direct txpool clearing method available via client interface. State might be inconsistent.")
+            logger.warning("No direct txpool clearing method available via client interface. State might be inconsistent.")
         time.sleep(0.1) # Give client a moment
 
         # Reset all fuzzer nonces for accounts
@@ -233,7 +299,7 @@ class FuzzEngine:
         # Fetch current gas prices
         current_gas_prices = self.client.get_current_gas_prices()
         if not current_gas_prices:
-            print("ERROR: Could not fetch current gas prices. Using default values for initial setup.")
+            logger.error("Could not fetch current gas prices. Using default values for initial setup.")
             # Fallback to default values if fetching fails
             current_gas_prices = {
                 'gasPrice': core_config.STATE_NORMAL_TX_PRICE_INDICATOR,
@@ -243,62 +309,124 @@ class FuzzEngine:
             }
 
         # Add initial 'normal' transactions
-        print(f"INFO: Adding {self.initial_normal_tx_count} initial normal transactions.")
-        sent_count = 0
-        for i in range(self.txpool_size): # Iterate up to txpool_size accounts for initial txs
-            if sent_count >= self.initial_normal_tx_count:
-                break
-            sender_addr = self.account_manager.get_account_by_index(i)
-            if sender_addr is None:
-                print(f"WARN: Not enough accounts for initial normal txs. Only {sent_count} sent.")
-                break
-
-            # Use EIP-1559 parameters for initial normal transactions
-            initial_tx = FuzzTx(
-                account_manager_index=i,
-                sender_address=sender_addr,
-                nonce=self.account_manager.get_fuzzer_nonce(sender_addr), # Should be 0
-                tx_type=2, # EIP-1559 transaction
-                price=current_gas_prices['maxFeePerGas'], # Use 'price' for maxFeePerGas
-                max_priority_fee_per_gas=current_gas_prices['maxPriorityFeePerGas'],
-                value=1
-            )
-            tx_hash = self.client.sign_and_send_transfer(initial_tx, self.account_manager.get_private_key(sender_addr))
-            if tx_hash:
-                self.account_manager.increment_fuzzer_nonce(sender_addr)
-                sent_count += 1
-            else:
-                print(f"WARN: Failed to send initial normal tx from {sender_addr}.")
-
-            if sent_count >= self.initial_normal_tx_count:
-                break
+        logger.info("Adding %s initial normal transactions.", self.initial_normal_tx_count)
+        self._send_normal_txs(self.initial_normal_tx_count, current_gas_prices)
 
         # Add initial 'future' transactions if enabled
         if self.future_flag_enabled:
-            print(f"INFO: Adding {self.future_slots} initial future transactions.")
-            for i in range(self.future_slots):
-                # Future transactions use a high nonce (10000) and a specific value (2)
-                # They also use new accounts, incrementing the fuzzer's global account index.
-                future_tx = self._generate_future_tx( # Call internal method
-                    self.current_fuzzer_account_index, current_gas_prices
+            logger.info("Adding %s initial future transactions.", self.future_slots)
+            self._send_future_txs(self.future_slots, current_gas_prices)
+
+    def _send_transfers(self, txs: List[FuzzTx], ordered: bool = True) -> List[Optional[str]]:
+        """
+        Sends transactions through the client's batch interface.
+        A node may process the entries of one JSON-RPC batch in any order, so with `ordered` each
+        transaction is sent in its own request, after the previous one was answered: fuzzed input
+        sequences depend on arrival order (evictions, replacements). Without it, transactions share
+        a batch, except that one re-using the sender and nonce of an earlier one (a replacement)
+        starts a new batch, so it always reaches the node after the transaction it replaces.
+        Transactions whose sender has no known private key are skipped.
+
+        :param txs: The transactions to send, in order.
+        :param ordered: Whether the node must receive the transactions in the given order.
+        :return: The transaction hash for each transaction, or None where it was not sent.
+        """
+        tx_hashes: List[Optional[str]] = [None] * len(txs)
+        batch_positions: List[int] = []
+        batch_private_keys: List[str] = []
+        batch_keys: set = set() # (sender, nonce) pairs in the current batch
+
+        def flush_batch():
+            if batch_positions:
+                batch_hashes = self.client.sign_and_send_transfer_batch(
+                    [txs[position] for position in batch_positions], batch_private_keys
                 )
-                # Need to get the private key for the sender of the future_tx
-                future_tx_sender_private_key = self.account_manager.get_private_key(future_tx.sender_address)
-                if future_tx_sender_private_key is None:
-                    print(f"ERROR: Could not get private key for future tx sender {future_tx.sender_address}. Skipping.")
-                    continue
+                for position, tx_hash in zip(batch_positions, batch_hashes):
+                    tx_hashes[position] = tx_hash
+            batch_positions.clear()
+            batch_private_keys.clear()
+            batch_keys.clear()
+
+        get_private_key = self.account_manager.get_private_key
+        private_keys: Dict[str, Optional[str]] = {} # Per-call cache; inputs re-use a few senders across many txs
+        for position, tx in enumerate(txs):
+            try:
+                private_key = private_keys[tx.sender_address]
+            except KeyError:
+                private_key = private_keys[tx.sender_address] = get_private_key(tx.sender_address)
+            if private_key is None:
+                logger.error("Could not get private key for sender %s. Skipping tx.", tx.sender_address)
+                continue
+            tx_key = (tx.sender_address, tx.nonce)
+            if ordered or tx_key in batch_keys:
+                flush_batch()
+            batch_positions.append(position)
+            batch_private_keys.append(private_key)
+            batch_keys.add(tx_key)
+        flush_batch()
+        return tx_hashes
+
+    def _send_normal_txs(self, normal_tx_count: int, gas_prices: Dict[str, int]) -> int:
+        """
+        Sends up to `normal_tx_count` 'normal' transactions, one per account starting at account 0.
+        Each round is sent as one batch; accounts whose transaction fails are replaced by the next
+        accounts in a further round, up to `txpool_size` accounts in total.
+
+        :return: The number of normal transactions sent.
+        """
+        sent_count = 0
+        next_account_index = 0
+        while sent_count < normal_tx_count and next_account_index < self.txpool_size:
+            normal_txs: List[FuzzTx] = []
+            while len(normal_txs) < normal_tx_count - sent_count and next_account_index < self.txpool_size:
+                sender_addr = self.account_manager.get_account_by_index(next_account_index)
+                if sender_addr is None:
+                    logger.warning("Not enough accounts for normal txs. Only %s available.", sent_count + len(normal_txs))
+                    next_account_index = self.txpool_size # No further accounts to try
+                    break
+                # Use EIP-1559 parameters for normal transactions
+                normal_txs.append(FuzzTx(
+                    account_manager_index=next_account_index,
+                    sender_address=sender_addr,
+                    nonce=self.account_manager.get_fuzzer_nonce(sender_addr), # Should be 0
+                    tx_type=2, # EIP-1559 transaction
+                    price=gas_prices['maxFeePerGas'], # Use 'price' for maxFeePerGas
+                    max_priority_fee_per_gas=gas_prices['maxPriorityFeePerGas'],
+                    value=1
+                ))
+                next_account_index += 1
 
-                tx_hash = self.client.sign_and_send_transfer(future_tx, future_tx_sender_private_key)
+            # One tx per account into a pool with room for them all: arrival order does not matter
+            for normal_tx, tx_hash in zip(normal_txs, self._send_transfers(normal_txs, ordered=False)):
                 if tx_hash:
-                    self.current_fuzzer_account_index += 1 # Increment for next future tx
+                    self.account_manager.increment_fuzzer_nonce(normal_tx.sender_address)
+                    sent_count += 1
                 else:
-                    print(f"WARN: Failed to send initial future tx from {future_tx.sender_address}.")
+                    logger.warning("Failed to send normal tx from %s.", normal_tx.sender_address)
+        return sent_count
+
+    def _send_future_txs(self, future_tx_count: int, gas_prices: Dict[str, int]):
+        """
+        Sends `future_tx_count` 'future' transactions (high nonce, low value) in one batch, using
+        new accounts from the fuzzer's global account index, which advances per transaction sent.
+        """
+        future_txs = [
+            self._generate_future_tx(self.current_fuzzer_account_index + offset, gas_prices) # Call internal method
+            for offset in range(future_tx_count)
+        ]
+        for future_tx, tx_hash in zip(future_txs, self._send_transfers(future_txs, ordered=False)): # One per account
+            if tx_hash:
+                self.current_fuzzer_account_index += 1 # Increment for next future tx
+            else:
+                logger.warning("Failed to send future tx from %s.", future_tx.sender_address)
 
 
     def _execute_input_sequence(self,
                                 input_to_execute: FuzzInput,
                                 initial_pool_state_to_recreate: Optional[Dict[str, Any]] = None,
-                                 base_input_for_recreation: Optional[FuzzInput] = None # The input that led to initial_pool_state_to_recreate
+                                 base_input_for_recreation: Optional[FuzzInput] = None, # The input that led to initial_pool_state_to_recreate
+                                 base_normal_count: Optional[int] = None, # Normal txs in initial_pool_state_to_recreate, if known
+                                 base_future_count: Optional[int] = None # Future txs in initial_pool_state_to_recreate, if known
                                ) -> Optional[Dict[str, Any]]:
         """
         Executes a sequence of transactions against the Ethereum client.
@@ -311,149 +439,249 @@ class FuzzEngine:
                                                 If None, performs initial setup (`_reset_and_initial_pool_setup`).
         :param base_input_for_recreation: The FuzzInput object that originally led to `initial_pool_state_to_recreate`.
                                            Used to get `base_input_indices_to_resend`.
+        :param base_normal_count: Number of normal ('N') txs in `initial_pool_state_to_recreate`
+                                  (e.g. the seed's `normal_count`). Derived from the pool if not given.
+        :param base_future_count: Number of future ('F') txs in `initial_pool_state_to_recreate`
+                                  (e.g. the seed's `future_count`). Derived from the pool if not given.
         :return: The new raw txpool content after execution, or None if an error occurred.
         """
-        print(f"DEBUG: _execute_input_sequence called with input_to_execute: {input_to_execute}")
-        print(f"DEBUG: Type of input_to_execute: {type(input_to_execute)}")
-        print(f"DEBUG: Type of input_to_execute.tx_sequence_to_execute: {type(input_to_execute.tx_sequence_to_execute)}")
-        print(f"DEBUG: Content of input_to_execute.tx_sequence_to_execute: {input_to_execute.tx_sequence_to_execute}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("_execute_input_sequence called with input_to_execute: %s", input_to_execute)
+            logger.debug("Type of input_to_execute: %s", type(input_to_execute))
+            logger.debug("Type of input_to_execute.tx_sequence_to_execute: %s", type(input_to_execute.tx_sequence_to_execute))
+            logger.debug("Content of input_to_execute.tx_sequence_to_execute: %s", input_to_execute.tx_sequence_to_execute)
 
         if initial_pool_state_to_recreate is None:
             # This is the very first execution (state == None in original)
             self._reset_and_initial_pool_setup()
             # After initial setup, send the transactions from the current input_to_execute
-            for tx_intent in input_to_execute.tx_sequence_to_execute:
-                # For initial setup, recipient is often sender itself or accounts2[0]
-                # Let's use the default recipient for now.
-                sender_private_key = self.account_manager.get_private_key(tx_intent.sender_address)
-                if sender_private_key is None:
-                    print(f"ERROR: Could not get private key for sender {tx_intent.sender_address}. Skipping tx.")
-                    continue
-                self.client.sign_and_send_transfer(tx_intent, sender_private_key)
-                # Nonce increment is handled by the fuzzer loop after successful txs.
+            # For initial setup, recipient is often sender itself or accounts2[0]
+            # Let's use the default recipient for now.
+            self._send_transfers(input_to_execute.tx_sequence_to_execute)
+            # Nonce increment is handled by the fuzzer loop after successful txs.
         else:
             # Recreate the previous state by clearing and re-sending specific transactions.
             # This corresponds to the `else` branch of `execute` in original scripts.
-            print("INFO: Recreating previous pool state and applying new input.")
-            # Use client.reset_state() if available, otherwise clear_txpool_custom()
-            try:
-                self.client.reset_state()
-                print("INFO: Client state reset via reset_state method for recreation.")
-            except NotImplementedError:
-                print("WARN: Client does not support direct state reset. Attempting to clear txpool only for recreation.")
-                if not self.client.clear_txpool_custom():
-                    print("WARN: Failed to clear txpool for state recreation. Cannot guarantee consistent base state.")
-                    return None # Cannot proceed if pool cannot be cleared
-
-            # Reset nonces for accounts involved in the base state recreation
-            # The original scripts reset all nonces to 0, then re-sent.
-            self.account_manager.reset_all_fuzzer_nonces(core_config.DEFAULT_INITIAL_NONCE)
-            self.current_fuzzer_account_index = 0 # Reset fuzzer's account counter
-
-            # Fetch current gas prices for state recreation
-            current_gas_prices = self.client.get_current_gas_prices()
-            if not current_gas_prices:
-                print("ERROR: Could not fetch current gas prices for state recreation. Using default values.")
-                current_gas_prices = {
-                    'gasPrice': core_config.STATE_NORMAL_TX_PRICE_INDICATOR,
-                    'maxFeePerGas': core_config.STATE_NORMAL_TX_PRICE_INDICATOR,
-                    'maxPriorityFeePerGas': core_config.STATE_NORMAL_TX_PRICE_INDICATOR,
-                    'maxFeePerBlobGas': 0
-                }
-
-            # Re-send 'normal' transactions (price 3) based on symbolic state of `initial_pool_state_to_recreate`
+            logger.info("Recreating previous pool state and applying new input.")
+            if not self._recreate_base_state(initial_pool_state_to_recreate, base_input_for_recreation,
+                                             base_normal_count, base_future_count):
+                return None
+            self._apply_input_sequence(input_to_execute)
+
+        # After all transactions are sent, get the final txpool state
+        final_txpool_state = self.client.get_txpool_content()
+        return final_txpool_state
+
+
+    def _recreate_base_state(self,
+                             initial_pool_state_to_recreate: Dict[str, Any],
+                             base_input_for_recreation: Optional[FuzzInput] = None,
+                             base_normal_count: Optional[int] = None,
+                             base_future_count: Optional[int] = None
+                            ) -> bool:
+        """
+        Resets the client and re-sends the normal, future and base-input transactions that make up
+        `initial_pool_state_to_recreate`. See `_execute_input_sequence` for the parameters.
+
+        :return: True if the base state was recreated, False if the pool could not be reset.
+        """
+        # Use client.reset_state() if available, otherwise clear_txpool_custom()
+        try:
+            self.client.reset_state()
+            logger.info("Client state reset via reset_state method for recreation.")
+        except NotImplementedError:
+            logger.warning("Client does not support direct state reset. Attempting to clear txpool only for recreation.")
+            if not self.client.clear_txpool_custom():
+                logger.warning("Failed to clear txpool for state recreation. Cannot guarantee consistent base state.")
+                return False # Cannot proceed if pool cannot be cleared
+
+        # Reset nonces for accounts involved in the base state recreation
+        # The original scripts reset all nonces to 0, then re-sent.
+        self.account_manager.reset_all_fuzzer_nonces(core_config.DEFAULT_INITIAL_NONCE)
+        self.current_fuzzer_account_index = 0 # Reset fuzzer's account counter
+
+        # Fetch current gas prices for state recreation
+        current_gas_prices = self.client.get_current_gas_prices()
+        if not current_gas_prices:
+            logger.error("Could not fetch current gas prices for state recreation. Using default values.")
+            current_gas_prices = {
+                'gasPrice': core_config.STATE_NORMAL_TX_PRICE_INDICATOR,
+                'maxFeePerGas': core_config.STATE_NORMAL_TX_PRICE_INDICATOR,
+                'maxPriorityFeePerGas': core_config.STATE_NORMAL_TX_PRICE_INDICATOR,
+                'maxFeePerBlobGas': 0
+            }
+
+        # Re-send 'normal' transactions (price 3) based on symbolic state of `initial_pool_state_to_recreate`
+        if base_normal_count is None or base_future_count is None:
             symbolic_base_state = get_symbolic_pool_state(initial_pool_state_to_recreate, self.txpool_size)
-            normal_tx_count_in_base = symbolic_base_state.count('N')
+            base_normal_count = symbolic_base_state.count('N')
+            base_future_count = symbolic_base_state.count('F')
 
-            sent_normal_count = 0
-            for i in range(self.txpool_size): # Iterate through accounts for normal txs
-                if sent_normal_count >= normal_tx_count_in_base:
-                    break
-                sender_addr = self.account_manager.get_account_by_index(i)
-                if sender_addr is None: break
+        self._send_normal_txs(base_normal_count, current_gas_prices)
 
-                # Use EIP-1559 parameters for initial normal transactions during recreation
-                initial_normal_tx = FuzzTx(
-                    account_manager_index=i,
-                    sender_address=sender_addr,
-                    nonce=self.account_manager.get_fuzzer_nonce(sender_addr), # Should be 0
-                    tx_type=2, # EIP-1559 transaction
-                    price=current_gas_prices['maxFeePerGas'], # Use 'price' for maxFeePerGas
-                    max_priority_fee_per_gas=current_gas_prices['maxPriorityFeePerGas'],
-                    value=1
-                )
-                sender_private_key = self.account_manager.get_private_key(sender_addr)
-                if sender_private_key is None:
-                    print(f"ERROR: Could not get private key for sender {sender_addr}. Skipping normal tx.")
-                    continue
-                tx_hash = self.client.sign_and_send_transfer(initial_normal_tx, sender_private_key)
-                if tx_hash:
-                    self.account_manager.increment_fuzzer_nonce(sender_addr)
-                    sent_normal_count += 1
+        # Re-send 'future' transactions if enabled and present in base state
+        if self.future_flag_enabled:
+            self._send_future_txs(base_future_count, current_gas_prices)
+
+        # Re-send transactions from the previous input that were marked as "in pool"
+        # This is the `tx_indexs` part of the original `Input` class.
+        if base_input_for_recreation and base_input_for_recreation.base_input_indices_to_resend:
+            txs_to_resend: List[FuzzTx] = []
+            for idx in sorted(base_input_for_recreation.base_input_indices_to_resend):
+                if idx < len(base_input_for_recreation.tx_sequence_to_execute):
+                    # The original `resend` function just calls `send` with the tx's original nonce.
+                    # This implies the fuzzer's nonce tracking is separate from the tx's nonce for these.
+                    txs_to_resend.append(base_input_for_recreation.tx_sequence_to_execute[idx])
                 else:
-                    print(f"WARN: Failed to re-send normal tx from {sender_addr}.")
-
-            # Re-send 'future' transactions if enabled and present in base state
-            if self.future_flag_enabled:
-                future_tx_count_in_base = symbolic_base_state.count('F')
-                for i in range(future_tx_count_in_base):
-                    future_tx = self._generate_future_tx( # Call internal method
-                        self.current_fuzzer_account_index, current_gas_prices
-                    )
-                    future_tx_sender_private_key = self.account_manager.get_private_key(future_tx.sender_address)
-                    if future_tx_sender_private_key is None:
-                        print(f"ERROR: Could not get private key for future tx sender {future_tx.sender_address}. Skipping.")
-                        continue
-                    tx_hash = self.client.sign_and_send_transfer(future_tx, future_tx_sender_private_key)
-                    if tx_hash:
-                        self.current_fuzzer_account_index += 1
-                    else:
-                        print(f"WARN: Failed to re-send future tx from {future_tx.sender_address} during state recreation.")
-
-            # Re-send transactions from the previous input that were marked as "in pool"
-            # This is the `tx_indexs` part of the original `Input` class.
-            if base_input_for_recreation and base_input_for_recreation.base_input_indices_to_resend:
-                sorted_indices = sorted(base_input_for_recreation.base_input_indices_to_resend)
-                for idx in sorted_indices:
-                    if idx < len(base_input_for_recreation.tx_sequence_to_execute):
-                        tx_to_resend = base_input_for_recreation.tx_sequence_to_execute[idx]
-                        # The original `resend` function just calls `send` with the tx's original nonce.
-                        # This implies the fuzzer's nonce tracking is separate from the tx's nonce for these.
-                        tx_to_resend_private_key = self.account_manager.get_private_key(tx_to_resend.sender_address)
-                        if tx_to_resend_private_key is None:
-                            print(f"ERROR: Could not get private key for re-sent tx sender {tx_to_resend.sender_address}. Skipping.")
-                            continue
-                        self.client.sign_and_send_transfer(tx_to_resend, tx_to_resend_private_key)
-                        # Do NOT increment fuzzer nonce for these re-sent transactions, as they are part of base state.
-                    else:
-                        print(f"WARN: Invalid index {idx} in base_input_for_recreation.base_input_indices_to_resend. Skipping.")
-
-            # Finally, send the transactions from the current `input_to_execute`
-            # The original `execute` also re-sent the *last* tx if len > 1.
-            # This is a specific heuristic. Let's apply the full sequence.
-            for tx_intent in input_to_execute.tx_sequence_to_execute:
-                sender_private_key = self.account_manager.get_private_key(tx_intent.sender_address)
-                if sender_private_key is None:
-                    print(f"ERROR: Could not get private key for sender {tx_intent.sender_address}. Skipping tx.")
-                    continue
-                tx_hash = self.client.sign_and_send_transfer(tx_intent, sender_private_key)
-                if tx_hash:
-                    # Only increment nonce if the transaction was successfully sent and is not a future tx
-                    if tx_intent.nonce != 10000:
-                        self.account_manager.increment_fuzzer_nonce(tx_intent.sender_address)
+                    logger.warning("Invalid index %s in base_input_for_recreation.base_input_indices_to_resend. Skipping.", idx)
+            self._send_transfers(txs_to_resend)
+            # Do NOT increment fuzzer nonce for these re-sent transactions, as they are part of base state.
+        return True
+
+    def _apply_input_sequence(self, input_to_execute: FuzzInput):
+        """
+        Sends the transactions of `input_to_execute` on top of the current (base) pool state,
+        advancing the fuzzer nonce of every sender whose non-future transaction was sent.
+        """
+        # Finally, send the transactions from the current `input_to_execute`
+        # The original `execute` also re-sent the *last* tx if len > 1.
+        # This is a specific heuristic. Let's apply the full sequence.
+        input_txs = input_to_execute.tx_sequence_to_execute
+        for tx_intent, tx_hash in zip(input_txs, self._send_transfers(input_txs)):
+            if tx_hash:
+                # Only increment nonce if the transaction was successfully sent and is not a future tx
+                if tx_intent.nonce != 10000:
+                    self.account_manager.increment_fuzzer_nonce(tx_intent.sender_address)
+            else:
+                logger.warning("Failed to send tx from %s (Nonce: %s) during input execution.", tx_intent.sender_address, tx_intent.nonce)
+
+    def _checkpoint_base_state(self, seed: Seed) -> Optional[Dict[str, Any]]:
+        """
+        Recreates the base state of `seed` once and snapshots it, so that every input mutated from
+        this seed can start from a client-side revert instead of a full reset-and-replay.
+
+        :return: A checkpoint for `_restore_base_checkpoint`, or None if the client cannot snapshot
+                 (callers then fall back to `_execute_input_sequence`).
+        """
+        if not self._snapshots_supported:
+            return None
+        if seed.txpool_state is None:
+            # The initial state: the freshly reset pool with the initial normal (and future) txs
+            self._reset_and_initial_pool_setup()
+        elif not self._recreate_base_state(seed.txpool_state, seed.fuzz_input, seed.normal_count, seed.future_count):
+            return None
+        try:
+            snapshot_id = self.client.snapshot()
+            base_txpool_state = self.client.get_txpool_content()
+        except Exception as e:
+            logger.info("Client state snapshots unavailable (%s). Recreating the base state for every input.", e)
+            self._snapshots_supported = False
+            return None
+        return {
+            "snapshot_id": snapshot_id,
+            "txpool_state": base_txpool_state,
+            "fuzzer_nonces": self.account_manager.snapshot_fuzzer_nonces(),
+            "fuzzer_account_index": self.current_fuzzer_account_index
+        }
+
+    def _restore_base_checkpoint(self, checkpoint: Dict[str, Any]) -> bool:
+        """
+        Reverts the client to a checkpoint taken by `_checkpoint_base_state` and restores the
+        fuzzer's nonce and account bookkeeping to match it.
+
+        :return: True if the base state was restored, False if the caller must recreate it instead.
+        """
+        try:
+            self.client.revert(checkpoint["snapshot_id"])
+            # Reverting consumes the snapshot on Anvil/Hardhat-style nodes; take a fresh one for the next input
+            checkpoint["snapshot_id"] = self.client.snapshot()
+            restored_txpool_state = self.client.get_txpool_content()
+        except Exception as e:
+            logger.warning("Could not revert to the base state snapshot (%s). Recreating the base state instead.", e)
+            return False
+        if restored_txpool_state != checkpoint["txpool_state"]:
+            logger.warning("Reverting to a snapshot did not restore the txpool. Recreating the base state for every input.")
+            self._snapshots_supported = False
+            return False
+        self.account_manager.restore_fuzzer_nonces(checkpoint["fuzzer_nonces"])
+        self.current_fuzzer_account_index = checkpoint["fuzzer_account_index"]
+        return True
+
+    def _execute_inputs_from_seed(self, seed: Seed, inputs: List[FuzzInput]) -> List[Tuple[FuzzInput, Optional[Dict[str, Any]]]]:
+        """
+        Executes each input in turn, starting every one from the pool state of `seed`.
+        The seed's base state is recreated once and snapshotted, so each input only needs a revert
+        rather than a full reset-and-replay (when the client supports snapshots). The first input
+        runs directly on the freshly built base state.
+
+        :return: (input, resulting raw txpool content or None on failure) for each input, in order.
+        """
+        results: List[Tuple[FuzzInput, Optional[Dict[str, Any]]]] = []
+        base_checkpoint = self._checkpoint_base_state(seed) if inputs else None
+        at_base_state = base_checkpoint is not None # Taking the checkpoint leaves the client at the base state
+        for new_input in inputs:
+            if at_base_state or (base_checkpoint is not None and self._restore_base_checkpoint(base_checkpoint)):
+                at_base_state = False
+                if seed.txpool_state is None:
+                    # As in `_execute_input_sequence`, inputs on the initial state do not advance fuzzer nonces
+                    self._send_transfers(new_input.tx_sequence_to_execute)
                 else:
-                    print(f"WARN: Failed to send tx from {tx_intent.sender_address} (Nonce: {tx_intent.nonce}) during input execution.")
+                    self._apply_input_sequence(new_input)
+                new_txpool_state = self.client.get_txpool_content()
+            else:
+                base_checkpoint = None
+                new_txpool_state = self._execute_input_sequence(
+                    input_to_execute=new_input,
+                    initial_pool_state_to_recreate=seed.txpool_state,
+                    base_input_for_recreation=seed.fuzz_input, # Pass the input that led to seed.txpool_state
+                    base_normal_count=seed.normal_count, # Precomputed when the seed was created
+                    base_future_count=seed.future_count
+                )
 
-        # After all transactions are sent, get the final txpool state
-        final_txpool_state = self.client.get_txpool_content()
-        return final_txpool_state
+            # Update fuzzer's global account index based on the last transaction sent in `new_input`
+            # This is a heuristic from the original scripts.
+            if new_txpool_state is not None and new_input.tx_sequence_to_execute:
+                last_tx_in_input = new_input.tx_sequence_to_execute[-1]
+                if last_tx_in_input.account_manager_index >= self.current_fuzzer_account_index:
+                    self.current_fuzzer_account_index = last_tx_in_input.account_manager_index + 1
+
+            results.append((new_input, new_txpool_state))
+        return results
+
+    def _execute_mutated_inputs(self, seed: Seed, inputs: List[FuzzInput]) -> List[Tuple[FuzzInput, Optional[Dict[str, Any]]]]:
+        """
+        Executes the inputs mutated from `seed`. With worker clients configured, the inputs are split
+        into contiguous chunks that run concurrently, one chunk per client (each client must be a
+        separate node, since every input resets and rebuilds its client's pool).
 
+        :return: (input, resulting raw txpool content or None on failure) for each input, in order.
+        """
+        if not self._worker_engines or len(inputs) < 2:
+            return self._execute_inputs_from_seed(seed, inputs)
+
+        engines = [self] + self._worker_engines
+        for worker_engine in self._worker_engines:
+            worker_engine.current_fuzzer_account_index = self.current_fuzzer_account_index
+        chunk_size = -(-len(inputs) // len(engines)) # Ceiling division
+        chunks = [inputs[start:start + chunk_size] for start in range(0, len(inputs), chunk_size)]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            chunk_futures = [
+                executor.submit(engine._execute_inputs_from_seed, seed, chunk)
+                for engine, chunk in zip(engines, chunks)
+            ]
+            results = [result for chunk_future in chunk_futures for result in chunk_future.result()]
+        # Continue from the account index and fuzzer nonces the last input left behind, as the serial loop would
+        last_engine = engines[len(chunks) - 1]
+        self.current_fuzzer_account_index = last_engine.current_fuzzer_account_index
+        if last_engine is not self:
+            self.account_manager.restore_fuzzer_nonces(last_engine.account_manager.snapshot_fuzzer_nonces())
+        return results
 
     def run_fuzzing(self):
         """
         Executes the main fuzzing loop.
         """
-        print("INFO: Starting fuzzing campaign...")
+        logger.info("Starting fuzzing campaign...")
         start_time = time.time()
         exploit_count = 0
 
@@ -463,56 +691,57 @@ class FuzzEngine:
         iteration_count = 0
         while not self.seed_db.is_empty() and iteration_count < self.max_iterations and (time.time() - start_time) < self.global_timeout_seconds:
             iteration_count += 1
-            print(f"\n--- Fuzzing Iteration {iteration_count} ---")
-            print(f"Seeds in DB: {self.seed_db.count}")
+            logger.info("--- Fuzzing Iteration %s ---", iteration_count)
+            logger.info("Seeds in DB: %s", self.seed_db.count)
 
             current_seed = self.seed_db.get_next_seed()
             if current_seed is None:
-                print("INFO: Seed database is empty. Exiting fuzzing loop.")
+                logger.info("Seed database is empty. Exiting fuzzing loop.")
                 break
 
-            print(f"INFO: Processing seed: {current_seed}")
+            logger.info("Processing seed: %s", current_seed)
+
+            if iteration_count % core_config.SEED_EVICTION_INTERVAL_ITERATIONS == 0:
+                evicted = self.seed_db.evict_older_than(core_config.SEED_MAX_IDLE_SECONDS)
+                if evicted:
+                    logger.info("Evicted %s stale seeds from the seed database.", evicted)
 
-            # 1. Mutate the current seed's input to generate new inputs
+            # 1. Mutate the current seed's input to generate new inputs.
+            # Gas prices are fetched once here and shared by all strategies (the client caches them
+            # briefly and drops them on reset/revert); on a failed fetch strategies fetch themselves.
             mutated_inputs = self.mutation_strategy.mutate(
                 base_input=current_seed.fuzz_input,
                 current_txpool_state=current_seed.txpool_state,
-                current_fuzzer_account_index=self.current_fuzzer_account_index
+                current_fuzzer_account_index=self.current_fuzzer_account_index,
+                gas_prices=self.client.get_current_gas_prices()
             )
 
-            for new_input in mutated_inputs:
-                # Execute each new input, starting from the current seed's state
-                new_txpool_state = self._execute_input_sequence(
-                    input_to_execute=new_input,
-                    initial_pool_state_to_recreate=current_seed.txpool_state,
-                    base_input_for_recreation=current_seed.fuzz_input # Pass the input that led to current_seed.txpool_state
-                )
-
+            # 2. Execute the new inputs, each starting from the current seed's state
+            for new_input, new_txpool_state in self._execute_mutated_inputs(current_seed, mutated_inputs):
                 if new_txpool_state is None:
-                    print("WARN: Failed to execute input sequence. Skipping this path.")
+                    logger.warning("Failed to execute input sequence. Skipping this path.")
+                    continue
+                if not current_seed.exploit_found and new_txpool_state == current_seed.txpool_state:
+                    # The node accepted nothing new: same (known) state and energy, and not an exploit
                     continue
-
-                # Update fuzzer's global account index based on the last transaction sent in `new_input`
-                # This is a heuristic from the original scripts.
-                if new_input.tx_sequence_to_execute:
-                    last_tx_in_input = new_input.tx_sequence_to_execute[-1]
-                    if last_tx_in_input.account_manager_index >= self.current_fuzzer_account_index:
-                        self.current_fuzzer_account_index = last_tx_in_input.account_manager_index + 1
 
                 # 3. Analyze the new state
                 new_symbolic_state = get_symbolic_pool_state(new_txpool_state, self.txpool_size)
                 new_energy = get_txpool_energy(new_txpool_state)
 
                 # 4. Check for exploits
-                if self.exploit_condition.check_condition(new_txpool_state):
+                is_exploit = bool(self.exploit_condition.check_condition(new_txpool_state))
+                if is_exploit:
                     exploit_count += 1
-                    print(f"!!! EXPLOIT FOUND !!! (Total: {exploit_count})")
-                    print(f"  Symbolic Input: {self._parse_input_to_symbol(new_input)}")
-                    print(f"  Concrete Input: {self._concrete_input_to_string(new_input)}")
-                    print(f"  Symbolic End State: {new_symbolic_state}")
+                    input_symbol = self._parse_input_to_symbol(new_input)
+                    input_concrete = self._concrete_input_to_string(new_input)
+                    logger.info("!!! EXPLOIT FOUND !!! (Total: %s)", exploit_count)
+                    logger.info("  Symbolic Input: %s", input_symbol)
+                    logger.info("  Concrete Input: %s", input_concrete)
+                    logger.info("  Symbolic End State: %s", new_symbolic_state)
                     self.found_exploits.append({
-                        "input_symbol": self._parse_input_to_symbol(new_input),
-                        "input_concrete": self._concrete_input_to_string(new_input),
+                        "input_symbol": input_symbol,
+                        "input_concrete": input_concrete,
                         "end_state_symbol": new_symbolic_state,
                         "raw_txpool_state": new_txpool_state,
                         "seed_generation": current_seed.generation,
@@ -530,14 +759,15 @@ class FuzzEngine:
                     energy=new_energy,
                     label_for_graph=new_symbolic_state # For graphviz, can be more complex
                 )
+                new_seed.exploit_found = is_exploit
                 self.seed_db.add_seed(new_seed)
 
         end_time = time.time()
-        print("\n--- Fuzzing Campaign Finished ---")
-        print(f"Total time: {end_time - start_time:.2f} seconds")
-        print(f"Total iterations: {iteration_count}")
-        print(f"Total unique states explored: {self.seed_db.count}")
-        print(f"Total exploits found: {exploit_count}")
+        logger.info("--- Fuzzing Campaign Finished ---")
+        logger.info("Total time: %.2f seconds", end_time - start_time)
+        logger.info("Total iterations: %s", iteration_count)
+        logger.info("Total unique states explored: %s", len(self.seed_db.known_symbolic_states))
+        logger.info("Total exploits found: %s", exploit_count)
 
         return self.found_exploits
 
@@ -546,33 +776,27 @@ class FuzzEngine:
         Converts a FuzzInput's transaction sequence into a symbolic string.
         Corresponds to `parseInput` in original scripts.
         """
-        output = ""
+        symbols: List[str] = []
+        parent_price_threshold = core_config.STATE_PARENT_REPLACEMENT_PRICE_THRESHOLD
+        child_value_threshold = core_config.STATE_CHILD_VALUE_THRESHOLD
         sender_nonce_tracker: Dict[str, int] = {} # Tracks last seen nonce for each sender
         for tx in fuzz_input.tx_sequence_to_execute:
-            if tx.nonce == 0:
-                if tx.price < core_config.STATE_PARENT_REPLACEMENT_PRICE_THRESHOLD:
-                    output += "P"
-                else:
-                    output += "R"
+            nonce = tx.nonce
+            if nonce == 0:
+                symbols.append("P" if tx.price < parent_price_threshold else "R")
                 sender_nonce_tracker[tx.sender_address] = 0
-            elif tx.sender_address in sender_nonce_tracker and tx.nonce == sender_nonce_tracker[tx.sender_address] + 1:
+            elif sender_nonce_tracker.get(tx.sender_address) == nonce - 1: # Next nonce of a tracked sender
                 # Check if it's a child (C) or override (O)
-                if tx.value <= core_config.STATE_CHILD_VALUE_THRESHOLD:
-                    output += "C"
-                else:
-                    output += "O"
-                sender_nonce_tracker[tx.sender_address] = tx.nonce
+                symbols.append("C" if tx.value <= child_value_threshold else "O")
+                sender_nonce_tracker[tx.sender_address] = nonce
             # Transactions that don't fit P/R/C/O pattern (e.g., gapped nonces) are ignored in original symbolization.
-        return output
+        return "".join(symbols)
 
     def _concrete_input_to_string(self, fuzz_input: FuzzInput) -> List[str]:
         """
         Converts a FuzzInput's transaction sequence into a list of concrete string representations.
         Corresponds to `concreteInput` in original scripts.
         """
-        output_strings: List[str] = []
-        for tx in fuzz_input.tx_sequence_to_execute:
-            tx_string = (f"from: {tx.sender_address}, to: {self.default_recipient_address}, "
-                         f"nonce: {tx.nonce}, price: {tx.price}, value: {tx.value}")
-            output_strings.append(tx_string)
-        return output_strings
+        recipient = self.default_recipient_address
+        return [f"from: {tx.sender_address}, to: {recipient}, nonce: {tx.nonce}, price: {tx.price}, value: {tx.value}"
+                for tx in fuzz_input.tx_sequence_to_execute]
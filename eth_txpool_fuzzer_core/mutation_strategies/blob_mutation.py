@@ -6,13 +6,13 @@ Defines mutation strategies specifically for EIP-4844 blob transactions.
 eth_txpool_fuzzer_core/mutation_strategies/blob_mutation.py
 
 """
-import copy
 import random
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from eth_txpool_fuzzer_core.tx import FuzzTx, FuzzInput
 from eth_txpool_fuzzer_core.accounts import AccountManager
 from eth_txpool_fuzzer_core.strategies.base_strategy import MutationStrategy # Import base class from new location
+from eth_txpool_fuzzer_core.state import normalize_txpool
 from eth_txpool_fuzzer_core.blob_utils import generate_dummy_blob_data, generate_blob_versioned_hashes
 from eth_txpool_fuzzer_core.client_comms import EthereumClient #
 
@@ -38,10 +38,47 @@ class BlobTxMutationStrategy(MutationStrategy):
         if self.default_recipient_address is None:
             print("CRITICAL: BlobTxMutationStrategy initialized without a valid default recipient address.")
 
+    def _build_blob_tx(self,
+                       account_index: int,
+                       sender_addr: str,
+                       nonce: int,
+                       base_max_fee_per_gas: int,
+                       base_max_priority_fee_per_gas: int,
+                       max_fee_per_blob_gas: int,
+                       blob_hashes: List[Any]
+                      ) -> FuzzTx:
+        """
+        Builds a blob (EIP-4844) transaction from the fuzzer account at `account_index`. Its fee
+        caps are randomized, but never below the client's current ones.
+
+        :param account_index: AccountManager index of the sending account.
+        :param sender_addr: Address of that account.
+        :param nonce: The account's current fuzzer nonce.
+        :param base_max_fee_per_gas: Current maxFeePerGas reported by the client.
+        :param base_max_priority_fee_per_gas: Current maxPriorityFeePerGas reported by the client.
+        :param max_fee_per_blob_gas: The blob gas price cap of the new transaction.
+        :param blob_hashes: The versioned hashes the transaction commits to.
+        :return: The new FuzzTx.
+        """
+        # For EIP-4844, 'price' in FuzzTx maps to 'maxFeePerGas'
+        # 'max_priority_fee_per_gas' can be a small default or randomized
+        return FuzzTx(
+            account_manager_index=account_index,
+            sender_address=sender_addr,
+            nonce=nonce,
+            price=max(base_max_fee_per_gas, random.randrange(1, 101)), # maxFeePerGas
+            value=0, # Typically 0 for blob transactions
+            tx_type=3, # EIP-4844
+            max_priority_fee_per_gas=max(base_max_priority_fee_per_gas, random.randrange(1, 51)),
+            max_fee_per_blob_gas=max_fee_per_blob_gas,
+            blob_versioned_hashes=blob_hashes
+        )
+
     def mutate(self,
                base_input: FuzzInput,
                current_txpool_state: Optional[Dict[str, Any]],
-               current_fuzzer_account_index: int # The next index to use for new accounts
+               current_fuzzer_account_index: int, # The next index to use for new accounts
+               gas_prices: Optional[Dict[str, int]] = None
               ) -> List[FuzzInput]:
         """
         Generates a list of new FuzzInput objects by applying blob-specific mutations.
@@ -50,32 +87,22 @@ class BlobTxMutationStrategy(MutationStrategy):
 
         # Determine which transactions from the base_input are still in the pool
         # This is needed to recreate the base state for new mutations.
-        base_input_tx_in_pool_indices: List[int] = []
+        base_input_tx_in_pool_indices: Tuple[int, ...] = () # Shared by every input generated below
         if current_txpool_state:
-            all_tx_in_pool_details: List[Any] = [] # (sender, nonce, value, type)
-            pending_txs = current_txpool_state.get('pending', {})
-            queued_txs = current_txpool_state.get('queued', {})
-
-            for sender, txs_by_nonce_str in pending_txs.items():
-                for nonce_str in sorted(txs_by_nonce_str.keys(), key=int):
-                    tx_details = txs_by_nonce_str[nonce_str]
-                    try:
-                        all_tx_in_pool_details.append((sender, int(nonce_str), int(tx_details.get('value', '0'), 16), int(tx_details.get('type', '0'), 16)))
-                    except ValueError:
-                        pass # Malformed tx, skip
-
-            for sender, txs_by_nonce_str in queued_txs.items():
-                for nonce_str in sorted(txs_by_nonce_str.keys(), key=int):
-                    tx_details = txs_by_nonce_str[nonce_str]
-                    try:
-                        all_tx_in_pool_details.append((sender, int(nonce_str), int(tx_details.get('value', '0'), 16), int(tx_details.get('type', '0'), 16)))
-                    except ValueError:
-                        pass # Malformed tx, skip
-
-            for i, base_tx in enumerate(base_input.tx_sequence_to_execute):
-                if any(t[0] == base_tx.sender_address and t[1] == base_tx.nonce and t[2] == base_tx.value and t[3] == base_tx.tx_type
-                       for t in all_tx_in_pool_details):
-                    base_input_tx_in_pool_indices.append(i)
+            pool_tx_keys: set = set() # (sender, nonce, value, type) of every tx in the pool
+            normalized_pool = normalize_txpool(current_txpool_state) # Shared with the other strategies' parse
+            for section_txs in (normalized_pool['pending'], normalized_pool['queued']):
+                for sender, sender_txs in section_txs.items():
+                    for pool_tx in sender_txs:
+                        if pool_tx.value is not None and pool_tx.tx_type is not None: # Skip malformed txs
+                            pool_tx_keys.add((sender, pool_tx.nonce, pool_tx.value, pool_tx.tx_type))
+
+            base_input_tx_in_pool_indices = tuple(
+                i for i, base_tx in enumerate(base_input.tx_sequence_to_execute)
+                if (base_tx.sender_address, base_tx.nonce, base_tx.value, base_tx.tx_type) in pool_tx_keys
+            )
+
+        base_tx_sequence = base_input.tx_sequence_to_execute # Every mutation below extends this by one tx
 
         # Mutation 1: Add a new valid blob transaction
         # Use a new account for this new transaction
@@ -84,15 +111,17 @@ class BlobTxMutationStrategy(MutationStrategy):
         if sender_addr is None:
             print("WARN: Not enough accounts for new blob tx. Skipping new blob tx mutation.")
             return mutated_inputs # Cannot generate new blob tx without an account
+        # Every blob tx below comes from this account and nothing here advances its nonce
+        sender_nonce = self.account_manager.get_fuzzer_nonce(sender_addr) or 0
 
-        # Fetch current gas prices from the client
-        current_gas_prices = self.ethereum_client.get_current_gas_prices()
+        # Use the caller's gas prices, or fetch the current ones from the client
+        current_gas_prices = gas_prices if gas_prices is not None else self.ethereum_client.get_current_gas_prices()
         base_max_fee_per_gas = current_gas_prices.get('maxFeePerGas', 0)
         base_max_priority_fee_per_gas = current_gas_prices.get('maxPriorityFeePerGas', 0)
         base_max_fee_per_blob_gas = current_gas_prices.get('maxFeePerBlobGas', 0)
 
         # Generate dummy blob data and hashes
-        num_blobs = random.randint(1, self.max_blobs_per_tx)
+        num_blobs = random.randrange(1, self.max_blobs_per_tx + 1)
         dummy_blobs = generate_dummy_blob_data(num_blobs)
         # Pass the web3 instance from ethereum_client
         blob_hashes = generate_blob_versioned_hashes(self.ethereum_client.w3, dummy_blobs)
@@ -103,86 +132,30 @@ class BlobTxMutationStrategy(MutationStrategy):
 
         # Randomize blob gas price around the fetched base_max_fee_per_blob_gas
         # Ensure it's at least min_blob_gas_price
-        blob_gas_price = max(self.min_blob_gas_price, random.randint(base_max_fee_per_blob_gas // 2, base_max_fee_per_blob_gas * 2))
+        blob_gas_price = max(self.min_blob_gas_price, random.randrange(base_max_fee_per_blob_gas // 2, base_max_fee_per_blob_gas * 2 + 1))
 
-        # For EIP-4844, 'price' in FuzzTx maps to 'maxFeePerGas'
-        # 'max_priority_fee_per_gas' can be a small default or randomized
-        new_blob_tx = FuzzTx(
-            account_manager_index=new_fuzzer_acc_idx,
-            sender_address=sender_addr,
-            nonce=self.account_manager.get_fuzzer_nonce(sender_addr) or 0,
-            price=max(base_max_fee_per_gas, random.randint(1, 100)), # maxFeePerGas
-            value=0, # Typically 0 for blob transactions
-            tx_type=3, # EIP-4844
-            max_priority_fee_per_gas=max(base_max_priority_fee_per_gas, random.randint(1, 50)),
-            max_fee_per_blob_gas=blob_gas_price,
-            blob_versioned_hashes=blob_hashes
-        )
-        new_input_blob_seq = copy.deepcopy(base_input.tx_sequence_to_execute)
-        new_input_blob_seq.append(new_blob_tx)
-        mutated_inputs.append(FuzzInput(new_input_blob_seq, base_input_tx_in_pool_indices))
-
-        # Mutation 2: Add a blob transaction with very low/high blob gas price
-        if sender_addr: # Ensure sender_addr is valid from previous check
-            # Low blob gas price (ensure it's not zero, but very low)
-            low_blob_gas_price = max(1, self.min_blob_gas_price)
-            low_blob_tx = FuzzTx(
-                account_manager_index=new_fuzzer_acc_idx,
-                sender_address=sender_addr,
-                nonce=self.account_manager.get_fuzzer_nonce(sender_addr) or 0,
-                price=max(base_max_fee_per_gas, random.randint(1, 100)),
-                value=0,
-                tx_type=3,
-                max_priority_fee_per_gas=max(base_max_priority_fee_per_gas, random.randint(1, 50)),
-                max_fee_per_blob_gas=low_blob_gas_price,
-                blob_versioned_hashes=blob_hashes
-            )
-            new_input_low_blob_seq = copy.deepcopy(base_input.tx_sequence_to_execute)
-            new_input_low_blob_seq.append(low_blob_tx)
-            mutated_inputs.append(FuzzInput(new_input_low_blob_seq, base_input_tx_in_pool_indices))
-
-            # High blob gas price
-            high_blob_gas_price = self.max_blob_gas_price
-            high_blob_tx = FuzzTx(
-                account_manager_index=new_fuzzer_acc_idx,
-                sender_address=sender_addr,
-                nonce=self.account_manager.get_fuzzer_nonce(sender_addr) or 0,
-                price=max(base_max_fee_per_gas, random.randint(1, 100)),
-                value=0,
-                tx_type=3,
-                max_priority_fee_per_gas=max(base_max_priority_fee_per_gas, random.randint(1, 50)),
-                max_fee_per_blob_gas=high_blob_gas_price,
-                blob_versioned_hashes=blob_hashes
-            )
-            new_input_high_blob_seq = copy.deepcopy(base_input.tx_sequence_to_execute)
-            new_input_high_blob_seq.append(high_blob_tx)
-            mutated_inputs.append(FuzzInput(new_input_high_blob_seq, base_input_tx_in_pool_indices))
+        # Mutation 2: the same blob tx with a very low (but non-zero) and a very high blob gas price
+        low_blob_gas_price = max(1, self.min_blob_gas_price)
+        high_blob_gas_price = self.max_blob_gas_price
 
         # Mutation 3: Add a blob transaction with an "invalid" number of blob hashes
         # This might require a client that accepts such a transaction into the pool
         # but then rejects it later, or immediately rejects it.
-        # For now, we'll generate a mismatch between dummy_blobs and blob_hashes.
-        if sender_addr:
-            invalid_num_blobs = num_blobs + 1 # One more hash than actual blobs
-            dummy_blobs_for_invalid = generate_dummy_blob_data(num_blobs) # Actual blobs
-            # Manually create an "invalid" list of hashes (e.g., by duplicating one)
-            invalid_blob_hashes = generate_blob_versioned_hashes(self.ethereum_client.w3, dummy_blobs_for_invalid)
-            if invalid_blob_hashes:
-                invalid_blob_hashes.append(invalid_blob_hashes[0]) # Duplicate a hash to make count mismatch
-
-                invalid_blob_tx = FuzzTx(
-                    account_manager_index=new_fuzzer_acc_idx,
-                    sender_address=sender_addr,
-                    nonce=self.account_manager.get_fuzzer_nonce(sender_addr) or 0,
-                    price=max(base_max_fee_per_gas, random.randint(1, 100)),
-                    value=0,
-                    tx_type=3,
-                    max_priority_fee_per_gas=max(base_max_priority_fee_per_gas, random.randint(1, 50)),
-                    max_fee_per_blob_gas=blob_gas_price,
-                    blob_versioned_hashes=invalid_blob_hashes # This is the "invalid" part
-                )
-                new_input_invalid_blob_seq = copy.deepcopy(base_input.tx_sequence_to_execute)
-                new_input_invalid_blob_seq.append(invalid_blob_tx)
-                mutated_inputs.append(FuzzInput(new_input_invalid_blob_seq, base_input_tx_in_pool_indices))
+        # Reuse the hashes from Mutation 1, duplicating one to make the count mismatch
+        invalid_blob_hashes = [*blob_hashes, blob_hashes[0]] # blob_hashes is non-empty here
+
+        blob_tx_variants = (
+            (blob_gas_price, blob_hashes),
+            (low_blob_gas_price, blob_hashes),
+            (high_blob_gas_price, blob_hashes),
+            (blob_gas_price, invalid_blob_hashes), # This is the "invalid" part
+        )
+        for variant_blob_gas_price, variant_blob_hashes in blob_tx_variants:
+            blob_tx = self._build_blob_tx(
+                new_fuzzer_acc_idx, sender_addr, sender_nonce, base_max_fee_per_gas, base_max_priority_fee_per_gas,
+                variant_blob_gas_price, variant_blob_hashes
+            )
+            # Shallow: the base input's txs are shared
+            mutated_inputs.append(FuzzInput([*base_tx_sequence, blob_tx], base_input_tx_in_pool_indices))
 
         return mutated_inputs
@@ -3,20 +3,107 @@ Functions for analyzing and symbolizing the state of the Ethereum transaction po
 Includes logic for calculating "energy" of a state to guide fuzzing.
 """
 
-from typing import Dict, Any, List
+import threading
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 
 from . import config as core_config
 
 
-class SenderTxSummary:
-    """Helper class to store summary info about a sender's first pending transaction."""
-    def __init__(self, sender_address: str, first_tx_price: int, tx_count: int):
-        self.sender_address: str = sender_address
-        self.first_tx_price: int = first_tx_price
-        self.tx_count: int = tx_count
+class PoolTx(NamedTuple):
+    """
+    One txpool entry with its hex fields parsed to ints. A field that is absent from the
+    client's response is 0; a field that is present but malformed is None.
+    """
+    nonce: int
+    tx_type: Optional[int]
+    gas_price: Optional[int]
+    max_fee_per_gas: Optional[int]
+    value: Optional[int]
+    max_fee_per_blob_gas: Optional[int]
+    details: Dict[str, Any] # The raw entry, for fields that are not parsed here
+
+# Normalized form: section ('pending'/'queued') -> sender -> that sender's txs, sorted by nonce
+NormalizedTxPool = Dict[str, Dict[str, List[PoolTx]]]
+
+_NORMALIZED_CACHE_SIZE = 8
+# id(txpool_content) -> (txpool_content, normalized). Holding the pool keeps its id from being re-used.
+_normalized_cache: 'OrderedDict[int, Tuple[Dict[str, Any], NormalizedTxPool]]' = OrderedDict()
+_normalized_cache_lock = threading.Lock()
+
+
+def _parse_hex_field(tx_details: Dict[str, Any], key: str) -> Optional[int]:
+    """Parses a hex quantity from a txpool entry: 0 if absent, None if malformed."""
+    hex_value = tx_details.get(key)
+    if hex_value is None:
+        return 0
+    try:
+        return int(hex_value, 16)
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_txpool(txpool_content: Dict[str, Any]) -> NormalizedTxPool:
+    """
+    Parses the hex fields of every tx in a raw txpool content dict once, so that the mutation
+    strategies (and anything else reading the same pool) work on ints instead of re-parsing.
+    Results are cached by the identity of `txpool_content`, which must not be modified afterwards;
+    pools returned by the clients are treated as immutable throughout the fuzzer.
+
+    :raises ValueError: If a nonce key is not a decimal integer.
+    """
+    cache_key = id(txpool_content)
+    with _normalized_cache_lock:
+        cached = _normalized_cache.get(cache_key)
+        if cached is not None and cached[0] is txpool_content:
+            _normalized_cache.move_to_end(cache_key)
+            return cached[1]
+
+    normalized: NormalizedTxPool = {}
+    for section in ('pending', 'queued'):
+        section_txs: Dict[str, List[PoolTx]] = {}
+        for sender, txs_by_nonce_str in txpool_content.get(section, {}).items():
+            sender_txs = [
+                PoolTx(
+                    nonce=int(nonce_str),
+                    tx_type=_parse_hex_field(tx_details, 'type'),
+                    gas_price=_parse_hex_field(tx_details, 'gasPrice'),
+                    max_fee_per_gas=_parse_hex_field(tx_details, 'maxFeePerGas'),
+                    value=_parse_hex_field(tx_details, 'value'),
+                    max_fee_per_blob_gas=_parse_hex_field(tx_details, 'maxFeePerBlobGas'),
+                    details=tx_details
+                )
+                for nonce_str, tx_details in txs_by_nonce_str.items()
+            ]
+            sender_txs.sort(key=itemgetter(0)) # PoolTx.nonce
+            section_txs[sender] = sender_txs
+        normalized[section] = section_txs
+
+    with _normalized_cache_lock:
+        _normalized_cache[cache_key] = (txpool_content, normalized)
+        if len(_normalized_cache) > _NORMALIZED_CACHE_SIZE:
+            _normalized_cache.popitem(last=False) # Evict the least recently used pool
+    return normalized
+
+
+def _effective_gas_price(pool_tx: PoolTx) -> Optional[int]:
+    """
+    The price a tx competes with: maxFeePerGas for EIP-1559/4844 txs, gasPrice otherwise.
+    None if the type, the gasPrice, or the maxFeePerGas it needs is malformed.
+    """
+    if pool_tx.tx_type is None or pool_tx.gas_price is None:
+        return None
+    if pool_tx.tx_type in (2, 3):
+        return pool_tx.max_fee_per_gas
+    return pool_tx.gas_price
+
+
+def _has_blob_hashes(pool_tx: PoolTx) -> bool:
+    """Whether a blob tx carries a non-empty blobVersionedHashes list."""
+    blob_hashes = pool_tx.details.get('blobVersionedHashes')
+    return isinstance(blob_hashes, list) and len(blob_hashes) > 0
 
-    def __lt__(self, other: 'SenderTxSummary') -> bool:
-        return self.first_tx_price < other.first_tx_price
 
 def get_symbolic_pool_state(
     txpool_content: Dict[str, Any],
@@ -40,108 +127,77 @@ def get_symbolic_pool_state(
     - 'B': Valid EIP-4844 Blob transaction
     - 'I': Invalid EIP-4844 Blob transaction (e.g., malformed, too many blobs)
     """
-    pending_txs: Dict[str, Dict[str, Any]] = txpool_content.get('pending', {})
-    queued_txs: Dict[str, Dict[str, Any]] = txpool_content.get('queued', {})
+    normalized_pool = normalize_txpool(txpool_content) # Hex fields parsed once, shared with get_txpool_energy
+    pending_txs = normalized_pool['pending']
 
     future_tx_count = 0
-    for sender_queued_txs in queued_txs.values():
+    for sender_queued_txs in normalized_pool['queued'].values():
         # Check if the queued transaction is a future transaction (nonce 10000)
         # or if it's a blob transaction. For now, 'F' is only for nonce 10000.
-        for nonce_str in sender_queued_txs:
-            tx_details = sender_queued_txs[nonce_str]
-            tx_type = int(tx_details.get('type', '0'), 16) if 'type' in tx_details else 0
-            if int(nonce_str) == 10000 and tx_type != 3: # 'F' is for non-blob future txs
+        for pool_tx in sender_queued_txs:
+            if pool_tx.tx_type is None:
+                raise ValueError(f"Malformed type in queued tx N:{pool_tx.nonce}") # As int(type, 16) would
+            if pool_tx.nonce == 10000 and pool_tx.tx_type != 3: # 'F' is for non-blob future txs
                 future_tx_count += 1
 
     normal_sender_tx_count = 0  # Total count of txs from "normal" senders
 
-    # List to hold summaries for senders whose first tx is not "normal"
-    non_normal_sender_summaries: List[SenderTxSummary] = []
+    # (sender, first tx price, parsed txs) for senders whose first tx is not "normal"
+    non_normal_sender_summaries: List[Tuple[str, int, List[PoolTx]]] = []
 
     total_pending_tx_count = 0
     blob_tx_count = 0 # Count of valid blob transactions
     invalid_blob_tx_count = 0 # Count of invalid blob transactions
 
-    for sender_addr, txs_by_nonce_str in pending_txs.items():
-        if not txs_by_nonce_str:
+    for sender_addr, sender_txs in pending_txs.items():
+        if not sender_txs:
             continue
 
-        total_pending_tx_count += len(txs_by_nonce_str)
+        total_pending_tx_count += len(sender_txs)
 
-        # Nonces are strings in txpool_content, convert to int for sorting
-        sorted_nonce_keys = sorted(txs_by_nonce_str.keys(), key=int)
-
-        first_tx_details = txs_by_nonce_str[sorted_nonce_keys[0]]
-
-        try:
-            tx_type = int(first_tx_details.get('type', '0'), 16) if 'type' in first_tx_details else 0
-            # Gas price is hex string in txpool_content
-            first_tx_gas_price = int(first_tx_details.get('gasPrice', '0'), 16) if 'gasPrice' in first_tx_details else 0
-            # For EIP-1559/4844, use maxFeePerGas
-            if tx_type in [2, 3]:
-                first_tx_gas_price = int(first_tx_details.get('maxFeePerGas', '0'), 16) if 'maxFeePerGas' in first_tx_details else 0
-        except ValueError:
+        first_tx = sender_txs[0] # Sorted by nonce
+        # Gas price; for EIP-1559/4844, use maxFeePerGas
+        first_tx_gas_price = _effective_gas_price(first_tx)
+        if first_tx_gas_price is None:
             print(f"WARN: Malformed tx details for sender {sender_addr}, first tx. Skipping for symbolization.")
             continue # Skip this sender if details are malformed
 
-        if tx_type == 3: # EIP-4844 Blob Transaction
+        if first_tx.tx_type == 3: # EIP-4844 Blob Transaction
             # Check for validity of blob transaction for 'B' vs 'I'
             # This is a simplified check; a real client would do more.
             # We'll check if blobVersionedHashes is present and not empty.
-            blob_hashes = first_tx_details.get('blobVersionedHashes')
-            if blob_hashes and isinstance(blob_hashes, list) and len(blob_hashes) > 0:
-                blob_tx_count += len(txs_by_nonce_str)
+            if _has_blob_hashes(first_tx):
+                blob_tx_count += len(sender_txs)
             else:
-                invalid_blob_tx_count += len(txs_by_nonce_str)
+                invalid_blob_tx_count += len(sender_txs)
             continue # Blob transactions are handled separately, not as N/P/R/C/O
 
         if first_tx_gas_price == normal_tx_price_indicator:
-            normal_sender_tx_count += len(txs_by_nonce_str)
+            normal_sender_tx_count += len(sender_txs)
         else:
-            non_normal_sender_summaries.append(
-                SenderTxSummary(sender_addr, first_tx_gas_price, len(txs_by_nonce_str))
-            )
+            non_normal_sender_summaries.append((sender_addr, first_tx_gas_price, sender_txs))
 
-    # Sort non-normal senders by their first transaction's gas price
-    non_normal_sender_summaries.sort()
+    # Sort non-normal senders by their first transaction's gas price (stable, so ties keep pool order)
+    non_normal_sender_summaries.sort(key=itemgetter(1))
 
-    # Build the symbolic string parts
+    # Symbols for non-normal senders (P/R/C/O); the runs of E/F/B/I/N are added at the end
     symbolic_parts: List[str] = []
 
-    # Add 'N's for all transactions from normal senders
-    symbolic_parts.extend(['N'] * normal_sender_tx_count)
-
-    # Add symbols for non-normal senders (P/R/C/O)
-    for sender_summary in non_normal_sender_summaries:
-        sender_addr = sender_summary.sender_address
-        sender_pending_txs = pending_txs.get(sender_addr, {})
-        sorted_nonce_keys = sorted(sender_pending_txs.keys(), key=int)
-
+    for sender_addr, _, sender_txs in non_normal_sender_summaries:
         is_high_price_parent_chain = False # True if the first tx of this sender was 'R'
 
-        for i, nonce_str_key in enumerate(sorted_nonce_keys):
-            tx_details = sender_pending_txs[nonce_str_key]
-
-            try:
-                tx_value = int(tx_details.get('value', '0'), 16)
-                tx_gas_price = int(tx_details.get('gasPrice', '0'), 16)
-                tx_type = int(tx_details.get('type', '0'), 16) if 'type' in tx_details else 0
-                if tx_type in [2, 3]: # For EIP-1559/4844, use maxFeePerGas
-                    tx_gas_price = int(tx_details.get('maxFeePerGas', '0'), 16) if 'maxFeePerGas' in tx_details else 0
-            except ValueError:
-                print(f"WARN: Malformed value/gasPrice/type for tx {sender_addr} N:{nonce_str_key}. Symbolizing as 'O'.")
+        for i, pool_tx in enumerate(sender_txs):
+            tx_gas_price = _effective_gas_price(pool_tx)
+            if tx_gas_price is None or pool_tx.value is None:
+                print(f"WARN: Malformed value/gasPrice/type for tx {sender_addr} N:{pool_tx.nonce}. Symbolizing as 'O'.")
                 symbolic_parts.append('O')
                 continue
 
-            if tx_type == 3: # Should have been caught earlier, but as a safeguard
+            if pool_tx.tx_type == 3: # Should have been caught earlier, but as a safeguard
                 # This means a blob tx was somehow in non_normal_sender_summaries
                 # which should not happen if the initial filtering is correct.
                 # For robustness, symbolize as 'B' or 'I' here too.
-                blob_hashes = tx_details.get('blobVersionedHashes')
-                if blob_hashes and isinstance(blob_hashes, list) and len(blob_hashes) > 0:
-                    symbolic_parts.append('B')
-                else:
-                    symbolic_parts.append('I')
+                symbolic_parts.append('B' if _has_blob_hashes(pool_tx) else 'I')
                 continue
 
             if i == 0: # First transaction from this (non-normal) sender
@@ -152,25 +208,27 @@ def get_symbolic_pool_state(
                     symbolic_parts.append('P')
                     is_high_price_parent_chain = False
             else: # Subsequent (child) transaction
-                if is_high_price_parent_chain or tx_value > child_value_threshold:
+                if is_high_price_parent_chain or pool_tx.value > child_value_threshold:
                     symbolic_parts.append('O')
                 else:
                     symbolic_parts.append('C')
 
     # Calculate empty slots
-    # total_txs_in_pool = future_tx_count + normal_sender_tx_count + sum(s.tx_count for s in non_normal_sender_summaries)
+    # total_txs_in_pool = future_tx_count + normal_sender_tx_count + sum(len(txs) for _, _, txs in non_normal_sender_summaries)
     # The sum of tx_count from non_normal_sender_summaries is total_pending_tx_count - normal_sender_tx_count
     total_txs_in_pool = future_tx_count + total_pending_tx_count + blob_tx_count + invalid_blob_tx_count
     empty_slot_count = max(0, txpool_size_config - total_txs_in_pool)
 
-    # Final symbolic string construction: E, F, B, I, then sorted N/P/R/C/O
-    final_symbol_list: List[str] = ['E'] * empty_slot_count
-    final_symbol_list.extend(['F'] * future_tx_count)
-    final_symbol_list.extend(['B'] * blob_tx_count)
-    final_symbol_list.extend(['I'] * invalid_blob_tx_count)
-    final_symbol_list.extend(symbolic_parts) # Contains 'N's then sorted 'P/R/C/O's
-
-    return "".join(final_symbol_list)
+    # Final symbolic string construction: E, F, B, I, N, then sorted P/R/C/O.
+    # The single-symbol runs are built by string repetition rather than as per-character lists.
+    return "".join((
+        'E' * empty_slot_count,
+        'F' * future_tx_count,
+        'B' * blob_tx_count,
+        'I' * invalid_blob_tx_count,
+        'N' * normal_sender_tx_count,
+        *symbolic_parts,
+    ))
 
 
 def get_txpool_energy(
@@ -183,51 +241,43 @@ def get_txpool_energy(
     Lower energy is generally preferred by the fuzzer.
     Based on `getOutputEngergy` from original scripts, extended for blob transactions.
     """
-    pending_txs: Dict[str, Dict[str, Any]] = txpool_content.get('pending', {})
+    pending_txs = normalize_txpool(txpool_content)['pending'] # Usually cached by get_symbolic_pool_state
     energy = 0
     non_normal_parent_count = 0 # Count of senders whose first tx is not "normal"
     blob_tx_count = 0
     invalid_blob_tx_count = 0
 
-    for sender_addr, txs_by_nonce_str in pending_txs.items():
-        if not txs_by_nonce_str:
+    for sender_addr, sender_txs in pending_txs.items():
+        if not sender_txs:
             continue
 
-        sorted_nonce_keys = sorted(txs_by_nonce_str.keys(), key=int)
-        first_tx_details = txs_by_nonce_str[sorted_nonce_keys[0]]
-
-        try:
-            tx_type = int(first_tx_details.get('type', '0'), 16) if 'type' in first_tx_details else 0
-            first_tx_gas_price = int(first_tx_details.get('gasPrice', '0'), 16) if 'gasPrice' in first_tx_details else 0
-            if tx_type in [2, 3]: # For EIP-1559/4844, use maxFeePerGas
-                first_tx_gas_price = int(first_tx_details.get('maxFeePerGas', '0'), 16) if 'maxFeePerGas' in first_tx_details else 0
-
-            # Check for blob-specific fields
-            if tx_type == 3:
-                blob_hashes = first_tx_details.get('blobVersionedHashes')
-                if blob_hashes and isinstance(blob_hashes, list) and len(blob_hashes) > 0:
-                    blob_tx_count += len(txs_by_nonce_str)
-                    # Add energy based on blob gas price, e.g., higher energy for very low/high prices
-                    max_fee_per_blob_gas = int(first_tx_details.get('maxFeePerBlobGas', '0'), 16) if 'maxFeePerBlobGas' in first_tx_details else 0
+        first_tx = sender_txs[0] # Sorted by nonce
+        first_tx_gas_price = _effective_gas_price(first_tx) # For EIP-1559/4844, maxFeePerGas
+        if first_tx_gas_price is not None and first_tx.tx_type == 3: # Check for blob-specific fields
+            if _has_blob_hashes(first_tx):
+                blob_tx_count += len(sender_txs)
+                # Add energy based on blob gas price, e.g., higher energy for very low/high prices
+                max_fee_per_blob_gas = first_tx.max_fee_per_blob_gas
+                if max_fee_per_blob_gas is not None:
                     if max_fee_per_blob_gas < 10 or max_fee_per_blob_gas > 1000: # Example thresholds
                         energy += 5 # Boost energy for interesting blob gas prices
-                else:
-                    invalid_blob_tx_count += len(txs_by_nonce_str)
-                    energy += 10 # High energy for invalid blob transactions
-                continue # Blob transactions are handled, skip traditional energy calculation for this sender
+                    continue # Blob transactions are handled, skip traditional energy calculation for this sender
+                first_tx_gas_price = None # Malformed blob gas price: falls through as malformed, as before
+            else:
+                invalid_blob_tx_count += len(sender_txs)
+                energy += 10 # High energy for invalid blob transactions
+                continue
 
-        except ValueError:
+        if first_tx_gas_price is None:
             print(f"WARN: Malformed tx details for energy calc on sender {sender_addr}. Treating as non-normal.")
             first_tx_gas_price = normal_tx_price_indicator + 1
 
         if first_tx_gas_price != normal_tx_price_indicator:
             non_normal_parent_count += 1
-            for nonce_key in sorted_nonce_keys:
-                tx_details = txs_by_nonce_str[nonce_key]
-                try:
-                    tx_value = int(tx_details.get('value', '0'), 16)
-                except ValueError:
-                    print(f"WARN: Malformed value for energy calc on tx {sender_addr} N:{nonce_key}. Treating as high value.")
+            for pool_tx in sender_txs:
+                tx_value = pool_tx.value
+                if tx_value is None:
+                    print(f"WARN: Malformed value for energy calc on tx {sender_addr} N:{pool_tx.nonce}. Treating as high value.")
                     tx_value = child_value_threshold + 1
 
                 if tx_value > child_value_threshold: # High value "O" type txs
@@ -236,12 +286,11 @@ def get_txpool_energy(
                     energy += 1
         else: # This sender's sequence starts with a "normal" priced transaction
             # Original scripts add 3 per normal tx in the sequence
-            energy += (3 * len(txs_by_nonce_str))
+            energy += (3 * len(sender_txs))
 
     # Bonus energy based on the number of non_normal_parent_count
-    # Original: for i in range(attack_parent): energy += (4 + i)
-    for i in range(non_normal_parent_count):
-        energy += (4 + i)
+    # Original: for i in range(attack_parent): energy += (4 + i), i.e. sum(4 .. 4+k-1) = k*(k+7)/2
+    energy += non_normal_parent_count * (non_normal_parent_count + 7) // 2
 
     # Additional energy for blob transactions (can be adjusted)
     energy += blob_tx_count * 2 # Small energy for valid blobs
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
 from ..tx import FuzzInput
 from ..accounts import AccountManager
@@ -13,7 +13,8 @@ class MutationStrategy:
     def mutate(self,
                base_input: FuzzInput,
                current_txpool_state: Optional[Dict[str, Any]],
-               current_fuzzer_account_index: int # The next index to use for new accounts
+               current_fuzzer_account_index: int, # The next index to use for new accounts
+               gas_prices: Optional[Dict[str, int]] = None
               ) -> List[FuzzInput]:
         """
         Generates a list of new FuzzInput objects by applying various mutation
@@ -22,6 +23,26 @@ class MutationStrategy:
         :param base_input: The FuzzInput that led to the current_txpool_state.
         :param current_txpool_state: The raw txpool content to mutate from.
         :param current_fuzzer_account_index: The current global account index used by the fuzzer.
+        :param gas_prices: Current gas prices, as returned by `IEthereumClient.get_current_gas_prices`.
+                           If None, the strategy fetches them itself.
         :return: A list of new FuzzInput objects.
         """
         raise NotImplementedError("Subclasses must implement the mutate method.")
+
+    def iter_mutate(self,
+                    base_input: FuzzInput,
+                    current_txpool_state: Optional[Dict[str, Any]],
+                    current_fuzzer_account_index: int,
+                    gas_prices: Optional[Dict[str, int]] = None
+                   ) -> Iterator[FuzzInput]:
+        """
+        Yields the inputs `mutate` would return, in the same order, so a consumer that stops
+        early does not pay for the rest. Strategies that can generate lazily override this.
+
+        :param base_input: The FuzzInput that led to the current_txpool_state.
+        :param current_txpool_state: The raw txpool content to mutate from.
+        :param current_fuzzer_account_index: The current global account index used by the fuzzer.
+        :param gas_prices: Current gas prices, or None to let the strategy fetch them.
+        :return: An iterator over new FuzzInput objects.
+        """
+        return iter(self.mutate(base_input, current_txpool_state, current_fuzzer_account_index, gas_prices))
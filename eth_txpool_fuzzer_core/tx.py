@@ -1,13 +1,18 @@
 """
 Defines the basic data structures for transactions and fuzzing inputs.
 """
-from typing import Optional, List
+from typing import Optional, List, Sequence, Tuple
 from web3.types import HexBytes
 
 class Tx:
     """
     Represents a single transaction "intent" or "instruction" within the fuzzing logic.
     """
+    # Seeds keep every tx of their input alive for the whole campaign; slots drop the per-instance dict.
+    __slots__ = ("account_manager_index", "sender_address", "nonce", "price", "value", "tx_type",
+                 "max_priority_fee_per_gas", "max_fee_per_blob_gas", "blob_versioned_hashes",
+                 "tx_hash_on_submission")
+
     def __init__(self,
                  account_manager_index: int,
                  sender_address: str,
@@ -31,6 +36,24 @@ class Tx:
         self.blob_versioned_hashes: Optional[List[HexBytes]] = blob_versioned_hashes
         self.tx_hash_on_submission: Optional[str] = tx_hash_on_submission
 
+    def __copy__(self) -> "Tx":
+        # The generic copy protocol goes through __reduce_ex__ and is several times slower for slotted
+        # classes; mutations copy shared txs before re-pricing them, so build the copy directly.
+        return type(self)(self.account_manager_index, self.sender_address, self.nonce, self.price, self.value,
+                          self.tx_type, self.max_priority_fee_per_gas, self.max_fee_per_blob_gas,
+                          self.blob_versioned_hashes, self.tx_hash_on_submission)
+
+    def __deepcopy__(self, memo: dict) -> "Tx":
+        # Every field but the hash list is an immutable scalar (and HexBytes are immutable too),
+        # so only that list needs a fresh copy.
+        blob_versioned_hashes = self.blob_versioned_hashes
+        new_tx = type(self)(self.account_manager_index, self.sender_address, self.nonce, self.price, self.value,
+                            self.tx_type, self.max_priority_fee_per_gas, self.max_fee_per_blob_gas,
+                            list(blob_versioned_hashes) if blob_versioned_hashes is not None else None,
+                            self.tx_hash_on_submission)
+        memo[id(self)] = new_tx
+        return new_tx
+
     def __repr__(self) -> str:
         base_repr = (f"Tx(idx={self.account_manager_index}, sender='{self.sender_address[:10]}...', "
                      f"nonce={self.nonce}, value={self.value}, type={self.tx_type}")
@@ -52,19 +75,28 @@ class Input:
     It also includes indices of transactions from a previous input that need to be re-sent
     to recreate a base state, as per the original fuzzer's stateful execution model.
     """
+    # Every mutation allocates one of these, and every seed keeps one alive.
+    __slots__ = ("tx_sequence_to_execute", "base_input_indices_to_resend")
+
     def __init__(self,
                  tx_sequence_to_execute: List[Tx],
-                 base_input_indices_to_resend: Optional[List[int]] = None # Indices from the *previous* input to re-send
+                 base_input_indices_to_resend: Optional[Sequence[int]] = None # Indices from the *previous* input to re-send
                 ):
-        # Add debug print to see what is passed as tx_sequence_to_execute
-        print(f"DEBUG: Input.__init__ called. tx_sequence_to_execute type: {type(tx_sequence_to_execute)}, content: {tx_sequence_to_execute}")
         if not isinstance(tx_sequence_to_execute, list):
-            print(f"CRITICAL ERROR: Input.__init__ received non-list for tx_sequence_to_execute: {type(tx_sequence_to_execute)}")
-            # Raise an error or handle this unexpected type
             raise TypeError(f"Expected list for tx_sequence_to_execute, got {type(tx_sequence_to_execute)}")
 
         self.tx_sequence_to_execute: List[Tx] = tx_sequence_to_execute
-        self.base_input_indices_to_resend: List[int] = base_input_indices_to_resend if base_input_indices_to_resend is not None else []
+        # Stored as a tuple: mutation strategies share one index set across all their inputs, so it must
+        # not be modified in place. tuple() returns an existing tuple as is, without copying.
+        self.base_input_indices_to_resend: Tuple[int, ...] = tuple(base_input_indices_to_resend) if base_input_indices_to_resend is not None else ()
+
+    def __deepcopy__(self, memo: dict) -> "Input":
+        # The resend indices are an immutable tuple of ints and can be shared. The memo is checked
+        # as copy.deepcopy would, so a tx appearing twice in the sequence is copied once.
+        new_input = type(self)([memo.get(id(tx)) or tx.__deepcopy__(memo) for tx in self.tx_sequence_to_execute],
+                               self.base_input_indices_to_resend)
+        memo[id(self)] = new_input
+        return new_input
 
     def __repr__(self) -> str:
         return (f"Input(tx_count={len(self.tx_sequence_to_execute)}, "
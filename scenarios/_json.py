@@ -0,0 +1,27 @@
+# eth_txpool_fuzzer/scenarios/_json.py
+"""
+JSON encoding for scenario output: uses orjson when it is installed, the standard library otherwise.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError: # orjson is an optional speed-up, not a dependency
+    orjson = None
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Encodes `obj` as compact JSON text; the output is the same with or without orjson.
+
+    :param obj: The value to encode.
+    :param default: Called for values JSON cannot represent; returns an encodable replacement.
+    :return: The JSON text.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default).decode()
+        except orjson.JSONEncodeError:
+            pass # e.g. integers wider than 64 bits, which only the standard library encodes
+    return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,25 @@
+# eth_txpool_fuzzer/scenarios/_prune.py
+"""
+Pruning of redundant exploits from a scenario's results.
+"""
+
+from typing import Any, Dict, List
+
+def dedupe_by_end_state(found_exploits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Keeps only the first exploit found for each symbolic end state. The engine records an exploit
+    every time an input reaches an exploit state, so the same end state is typically reported
+    once per path that leads to it.
+
+    :param found_exploits: The exploit dicts returned by FuzzEngine.run_fuzzing(), in discovery order.
+    :return: The exploits with a new end state, in discovery order.
+    """
+    seen_end_states = set()
+    distinct_exploits: List[Dict[str, Any]] = []
+    for exploit in found_exploits:
+        end_state = exploit['end_state_symbol']
+        if end_state in seen_end_states:
+            continue
+        seen_end_states.add(end_state)
+        distinct_exploits.append(exploit)
+    return distinct_exploits
@@ -0,0 +1,53 @@
+# eth_txpool_fuzzer/scenarios/_reporting.py
+"""
+Output of the exploits a scenario found.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, TextIO
+
+from . import _json
+
+def _json_default(value: Any) -> Any:
+    """Encodes the non-JSON values found in raw txpool states (HexBytes, web3 AttributeDicts)."""
+    if isinstance(value, bytes):
+        return "0x" + value.hex()
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+# The text record for one exploit, filled in by a single format call instead of one f-string per line
+_format_exploit_text = (
+    "\nExploit {0}:\n"
+    "  Symbolic Input: {input_symbol}\n"
+    "  Concrete Input: {input_concrete}\n"
+    "  End State Symbol: {end_state_symbol}\n"
+    "  Found at Generation: {seed_generation}\n"
+    "  Time into Fuzzing: {time_found:.2f}s\n"
+).format
+
+def emit_exploits(found_exploits: List[Dict[str, Any]], fmt: str = "text", stream: Optional[TextIO] = None):
+    """
+    Writes the exploits found by a scenario to `stream` with a single write.
+
+    :param found_exploits: The exploit dicts returned by FuzzEngine.run_fuzzing().
+    :param fmt: "text" for the human-readable summary, or "jsonl" for one JSON object per exploit.
+    :param stream: Where to write (defaults to the current sys.stdout).
+    :raises ValueError: If `fmt` is not a supported format.
+    """
+    if stream is None:
+        stream = sys.stdout # Looked up per call, so redirected stdout is honored like print()
+    if fmt == "jsonl":
+        stream.write("".join(_json.dumps(exploit, default=_json_default) + "\n" for exploit in found_exploits))
+        return
+    if fmt != "text":
+        raise ValueError(f"Unsupported exploit output format: {fmt!r}")
+
+    if not found_exploits:
+        stream.write("No exploits found in this run.\n")
+        return
+
+    stream.write(f"Found {len(found_exploits)} exploit(s):\n" + "".join(
+        _format_exploit_text(i, **exploit) for i, exploit in enumerate(found_exploits, 1)
+    ))
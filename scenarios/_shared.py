@@ -0,0 +1,88 @@
+# eth_txpool_fuzzer/scenarios/_shared.py
+"""
+Process-wide factories for the objects every scenario builds, so that running several scenarios
+in one process loads the key files and connects to each node only once, and an opt-in on-disk
+cache of scenario results for repeated runs against an unchanged node.
+"""
+
+import functools
+import hashlib
+import inspect
+import shelve
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from eth_txpool_fuzzer_core.accounts import AccountManager
+from eth_txpool_fuzzer_core.client_comms import EthereumClient
+
+from ._reporting import emit_exploits
+
+# How long a cached scenario result is served before the scenario is run again
+SCENARIO_RESULT_CACHE_TTL_SECONDS = 3600.0
+
+@functools.lru_cache(maxsize=None)
+def get_account_manager(key_file_primary: str, key_file_secondary: str, max_accounts_to_load: int) -> AccountManager:
+    """
+    Returns the AccountManager for these key files, loading them on first use.
+    Sharing it across scenarios is safe: FuzzEngine resets every fuzzer nonce before a campaign.
+    Loading no accounts (e.g. a missing key file) raises (ValueError) and is not cached, so the
+    next call loads the files again.
+    """
+    account_manager = AccountManager(
+        key_file_paths=[key_file_primary, key_file_secondary],
+        max_accounts_to_load=max_accounts_to_load
+    )
+    if account_manager.loaded_account_count == 0:
+        raise ValueError(f"No accounts loaded from {key_file_primary} or {key_file_secondary}. Cannot proceed with fuzzing.")
+    return account_manager
+
+@functools.lru_cache(maxsize=None)
+def get_eth_client(rpc_url: str) -> EthereumClient:
+    """
+    Returns the connected EthereumClient for `rpc_url`, connecting on first use.
+    A failed connection raises (ConnectionError) and is not cached, so the next call retries.
+    """
+    return EthereumClient(rpc_url=rpc_url)
+
+def cached_scenario(scenario_fn: Callable[..., Optional[List[Dict[str, Any]]]]) -> Callable[..., Optional[List[Dict[str, Any]]]]:
+    """
+    Decorates a run_* scenario with an opt-in persistent result cache. Passing
+    `result_cache_path=<file>` to the decorated function serves the exploits of an earlier run
+    with the same arguments against the same chain head (block number), for up to
+    SCENARIO_RESULT_CACHE_TTL_SECONDS; without it, the scenario always runs.
+    Fuzzing is randomized, so a cache hit replays one earlier campaign rather than a new one.
+    Only campaigns that ran are cached: a scenario returning None (setup failed) runs again next time.
+    """
+    signature = inspect.signature(scenario_fn)
+
+    @functools.wraps(scenario_fn)
+    def wrapper(*args: Any, result_cache_path: Optional[str] = None, **kwargs: Any) -> Optional[List[Dict[str, Any]]]:
+        if result_cache_path is None:
+            return scenario_fn(*args, **kwargs)
+
+        bound_args = signature.bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        try:
+            block_number = get_eth_client(bound_args.arguments['rpc_url']).w3.eth.block_number
+        except Exception as e:
+            print(f"WARN: Could not read the chain head for the scenario result cache ({e}). Running uncached.")
+            return scenario_fn(*args, **kwargs)
+
+        cache_key = hashlib.blake2b(
+            repr((scenario_fn.__module__, scenario_fn.__qualname__,
+                  sorted(bound_args.arguments.items()), block_number)).encode()
+        ).hexdigest()
+        with shelve.open(result_cache_path) as cache:
+            cached = cache.get(cache_key)
+            if cached is not None and time.time() - cached[0] < SCENARIO_RESULT_CACHE_TTL_SECONDS:
+                print(f"INFO: Serving cached {scenario_fn.__name__} result from {result_cache_path}.")
+                emit_exploits(cached[1]) # The scenario body, which reports its results, is skipped
+                return cached[1]
+
+        found_exploits = scenario_fn(*args, **kwargs)
+        if found_exploits is not None:
+            with shelve.open(result_cache_path) as cache:
+                cache[cache_key] = (time.time(), found_exploits)
+        return found_exploits
+
+    return wrapper
@@ -3,18 +3,24 @@ Implements a fuzzing scenario specifically for EIP-4844 blob transactions.
 This scenario uses blob-specific mutation strategies and exploit detectors.
 """
 
-from typing import List
+import logging
+from typing import Final
 
 # Import core library components
-from eth_txpool_fuzzer_core.accounts import AccountManager
-from eth_txpool_fuzzer_core.client_comms import EthereumClient
 from eth_txpool_fuzzer_core.mutation import DefaultTxPoolMutation, CompositeMutationStrategy
 from eth_txpool_fuzzer_core.mutation_strategies.blob_mutation import BlobTxMutationStrategy
-from eth_txpool_fuzzer_core.exploit_detectors import ExploitCondition, CompositeExploitCondition, PendingEmptyExploit, LowCostStateExploit
-from eth_txpool_fuzzer_core.exploit_detectors_blob import BlobPoolStallExploit, BlobGasPriceManipulationExploit, InvalidBlobTxAcceptanceExploit
+from eth_txpool_fuzzer_core.exploit_detectors_blob import FusedBlobExploitCondition
 from eth_txpool_fuzzer_core.fuzz_engine import FuzzEngine
 from eth_txpool_fuzzer_core import config as core_config
 
+from ._prune import dedupe_by_end_state
+from ._reporting import emit_exploits
+from ._shared import cached_scenario, get_account_manager, get_eth_client
+
+_PRICE_LADDER_STEP: Final[int] = 1 # Can be configured
+_FUTURE_FLAG: Final[bool] = True # Enable future txs for a more complex pool state
+
+@cached_scenario
 def run_mempool_blob_scenario(
     rpc_url: str = core_config.DEFAULT_TARGET_URL,
     key_file_primary: str = core_config.DEFAULT_KEY_FILE_PRIMARY,
@@ -29,6 +35,7 @@ def run_mempool_blob_scenario(
 ):
     """
     Runs a fuzzing scenario specifically designed for EIP-4844 blob transactions.
+    Returns the list of exploits found, or None if setup failed (nothing was fuzzed).
     """
     print("--- Starting Mempool Blob Scenario ---")
     print(f"Target RPC: {rpc_url}")
@@ -39,26 +46,20 @@ def run_mempool_blob_scenario(
 
     # 1. Initialize AccountManager
     try:
-        account_manager = AccountManager(
-            key_file_paths=[key_file_primary, key_file_secondary],
-            max_accounts_to_load=core_config.MAX_ACCOUNTS_TO_LOAD
-        )
-        if account_manager.loaded_account_count == 0:
-            print("ERROR: No accounts loaded. Cannot proceed with fuzzing.")
-            return
+        account_manager = get_account_manager(key_file_primary, key_file_secondary, core_config.MAX_ACCOUNTS_TO_LOAD)
     except Exception as e:
         print(f"CRITICAL ERROR: Failed to initialize AccountManager: {e}")
-        return
+        return None
 
     # 2. Initialize EthereumClient
     try:
-        ethereum_client = EthereumClient(rpc_url=rpc_url)
+        ethereum_client = get_eth_client(rpc_url)
     except ConnectionError as e:
         print(f"CRITICAL ERROR: {e}")
-        return
+        return None
     except Exception as e:
         print(f"CRITICAL ERROR: Failed to initialize EthereumClient: {e}")
-        return
+        return None
 
     # 3. Initialize Mutation Strategies
     # Combine default mutations with blob-specific mutations
@@ -67,7 +68,7 @@ def run_mempool_blob_scenario(
         ethereum_client=ethereum_client, # Add ethereum_client
         txpool_size_config=txpool_size,
         future_slots_config=future_slots,
-        price_ladder_step_length=1 # Can be configured
+        price_ladder_step_length=_PRICE_LADDER_STEP
     )
     blob_mutation = BlobTxMutationStrategy(
         account_manager=account_manager,
@@ -78,20 +79,14 @@ def run_mempool_blob_scenario(
     )
     mutation_strategy = CompositeMutationStrategy(
         account_manager=account_manager,
+        ethereum_client=ethereum_client,
         strategies=[default_mutation, blob_mutation]
     )
 
     # 4. Initialize Exploit Conditions
-    # Combine existing exploit conditions with new blob-specific ones
-    exploit_conditions_list: List[ExploitCondition] = [
-        PendingEmptyExploit(),
-        LowCostStateExploit(txpool_size_override=txpool_size),
-        # EpsilonCostExploit(epsilon_value=0.5, txpool_size_override=txpool_size), # Example, if desired
-        BlobPoolStallExploit(),
-        BlobGasPriceManipulationExploit(min_blob_gas_price, max_blob_gas_price),
-        InvalidBlobTxAcceptanceExploit()
-    ]
-    exploit_condition = CompositeExploitCondition(exploit_conditions_list)
+    # Existing conditions (PendingEmptyExploit, LowCostStateExploit) plus the blob-specific ones,
+    # evaluated together in a single pass over each pool state
+    exploit_condition = FusedBlobExploitCondition(txpool_size, min_blob_gas_price, max_blob_gas_price)
 
     # 5. Initialize and Run FuzzEngine
     fuzz_engine = FuzzEngine(
@@ -105,25 +100,19 @@ def run_mempool_blob_scenario(
         initial_normal_tx_price=core_config.STATE_NORMAL_TX_PRICE_INDICATOR,
         max_iterations=max_fuzz_iterations,
         global_timeout_seconds=global_fuzz_timeout_seconds,
-        future_flag_enabled=True # Enable future txs for a more complex pool state
+        future_flag_enabled=_FUTURE_FLAG
     )
 
-    found_exploits = fuzz_engine.run_fuzzing()
+    # Keep one exploit per end state; the engine reports every path that reaches one
+    found_exploits = dedupe_by_end_state(fuzz_engine.run_fuzzing())
 
     print("\n--- Mempool Blob Scenario Results ---")
-    if found_exploits:
-        print(f"Found {len(found_exploits)} exploit(s):")
-        for i, exploit in enumerate(found_exploits):
-            print(f"\nExploit {i+1}:")
-            print(f"  Input Symbol: {exploit['input_symbol']}")
-            print(f"  Concrete Input: {exploit['input_concrete']}")
-            print(f"  End State Symbol: {exploit['end_state_symbol']}")
-            print(f"  Found at Generation: {exploit['seed_generation']}")
-            print(f"  Time into Fuzzing: {exploit['time_found']:.2f}s")
-    else:
-        print("No exploits found in this run.")
+    emit_exploits(found_exploits)
+
+    return found_exploits
 
 if __name__ == "__main__":
+    logging.basicConfig(level=core_config.LOG_LEVEL, format="%(levelname)s: %(message)s")
     run_mempool_blob_scenario(
         txpool_size=16,
         future_slots=4,
@@ -5,16 +5,24 @@ This script orchestrates the setup and execution of the FuzzEngine
 with specific configurations and exploit conditions, including an epsilon parameter.
 """
 
+import logging
 import sys
+from typing import Final
 
 # Import core library components
-from eth_txpool_fuzzer_core.accounts import AccountManager
-from eth_txpool_fuzzer_core.client_comms import EthereumClient
 from eth_txpool_fuzzer_core.mutation import DefaultTxPoolMutation
 from eth_txpool_fuzzer_core.exploit_detectors import EpsilonCostExploit
 from eth_txpool_fuzzer_core.fuzz_engine import FuzzEngine
 from eth_txpool_fuzzer_core import config as core_config
 
+from ._prune import dedupe_by_end_state
+from ._reporting import emit_exploits
+from ._shared import cached_scenario, get_account_manager, get_eth_client
+
+_PRICE_LADDER_STEP: Final[int] = 1 # Specific to mpfuzz_epsilon.py
+_FUTURE_FLAG: Final[bool] = False # mpfuzz_epsilon.py has future_flag = False
+
+@cached_scenario
 def run_mpfuzz_epsilon_scenario(
     epsilon: float, # Required parameter for this scenario
     rpc_url: str = core_config.DEFAULT_TARGET_URL,
@@ -27,6 +35,7 @@ def run_mpfuzz_epsilon_scenario(
 ):
     """
     Runs the fuzzing scenario mimicking the behavior of the original mpfuzz_epsilon.py.
+    Returns the list of exploits found, or None if setup failed (nothing was fuzzed).
     """
     print("--- Starting MPFuzz Epsilon Scenario ---")
     print(f"Target RPC: {rpc_url}")
@@ -36,34 +45,29 @@ def run_mpfuzz_epsilon_scenario(
 
     # 1. Initialize AccountManager
     try:
-        account_manager = AccountManager(
-            key_file_paths=[key_file_primary, key_file_secondary],
-            max_accounts_to_load=core_config.MAX_ACCOUNTS_TO_LOAD
-        )
-        if account_manager.loaded_account_count == 0:
-            print("ERROR: No accounts loaded. Cannot proceed with fuzzing.")
-            return
+        account_manager = get_account_manager(key_file_primary, key_file_secondary, core_config.MAX_ACCOUNTS_TO_LOAD)
     except Exception as e:
         print(f"CRITICAL ERROR: Failed to initialize AccountManager: {e}")
-        return
+        return None
 
     # 2. Initialize EthereumClient
     try:
-        ethereum_client = EthereumClient(rpc_url=rpc_url)
+        ethereum_client = get_eth_client(rpc_url)
     except ConnectionError as e:
         print(f"CRITICAL ERROR: {e}")
-        return
+        return None
     except Exception as e:
         print(f"CRITICAL ERROR: Failed to initialize EthereumClient: {e}")
-        return
+        return None
 
     # 3. Initialize MutationStrategy
     # mpfuzz_epsilon.py uses step_length = 1 for price laddering
     mutation_strategy = DefaultTxPoolMutation(
         account_manager=account_manager,
+        ethereum_client=ethereum_client,
         txpool_size_config=txpool_size,
         future_slots_config=future_slots,
-        price_ladder_step_length=1 # Specific to mpfuzz_epsilon.py
+        price_ladder_step_length=_PRICE_LADDER_STEP
     )
 
     # 4. Initialize ExploitCondition
@@ -88,25 +92,19 @@ def run_mpfuzz_epsilon_scenario(
         initial_normal_tx_price=core_config.STATE_NORMAL_TX_PRICE_INDICATOR,
         max_iterations=max_fuzz_iterations,
         global_timeout_seconds=global_fuzz_timeout_seconds,
-        future_flag_enabled=False # mpfuzz_epsilon.py has future_flag = False
+        future_flag_enabled=_FUTURE_FLAG
     )
 
-    found_exploits = fuzz_engine.run_fuzzing()
+    # Keep one exploit per end state; the engine reports every path that reaches one
+    found_exploits = dedupe_by_end_state(fuzz_engine.run_fuzzing())
 
     print("\n--- MPFuzz Epsilon Scenario Results ---")
-    if found_exploits:
-        print(f"Found {len(found_exploits)} exploit(s):")
-        for i, exploit in enumerate(found_exploits):
-            print(f"\nExploit {i+1}:")
-            print(f"  Symbolic Input: {exploit['input_symbol']}")
-            print(f"  Concrete Input: {exploit['input_concrete']}")
-            print(f"  End State Symbol: {exploit['end_state_symbol']}")
-            print(f"  Found at Generation: {exploit['seed_generation']}")
-            print(f"  Time into Fuzzing: {exploit['time_found']:.2f}s")
-    else:
-        print("No exploits found in this run.")
+    emit_exploits(found_exploits)
+
+    return found_exploits
 
 if __name__ == "__main__":
+    logging.basicConfig(level=core_config.LOG_LEVEL, format="%(levelname)s: %(message)s")
     # To run: python -m scenarios.mpfuzz_epsilon_scenario <epsilon_value>
     # Example: python -m scenarios.mpfuzz_epsilon_scenario 0.5
 
@@ -0,0 +1,97 @@
+# eth_txpool_fuzzer/scenarios/parallel_runner.py
+"""
+Runs several fuzzing scenarios side by side, one process per scenario, and merges their results.
+
+Every scenario resets and drives the state of the node it targets, so scenarios that run
+concurrently must each be given their own node (a distinct `rpc_url`).
+"""
+
+import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from eth_txpool_fuzzer_core import config as core_config
+
+from .mpfuzz_scenario import run_mpfuzz_scenario
+
+# A scenario entry point (e.g. run_mpfuzz_scenario) and the keyword arguments to call it with
+ScenarioCall = Tuple[Callable[..., Optional[List[Dict[str, Any]]]], Dict[str, Any]]
+
+def _run_scenario(scenario_fn: Callable[..., Optional[List[Dict[str, Any]]]], kwargs: Dict[str, Any],
+                  cpu: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Worker entry point: runs one scenario in the worker process, pinned to `cpu` if given."""
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    logging.basicConfig(level=core_config.LOG_LEVEL, format="%(levelname)s: %(message)s")
+    return scenario_fn(**kwargs) or [] # None when the scenario's setup failed
+
+def run_scenarios_parallel(
+    scenario_calls: Sequence[ScenarioCall],
+    workers: Optional[int] = None,
+    pin_cpus: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Runs each scenario in its own worker process and merges the exploits they find.
+
+    Workers are started with the 'spawn' method, so each builds its own AccountManager and
+    EthereumClient (no RPC connection is shared across processes) and gets its own freshly
+    seeded `random` state.
+
+    :param scenario_calls: (scenario function, kwargs) pairs. The functions must be importable
+                           module-level callables, e.g. the run_* functions in this package.
+    :param workers: Number of worker processes (defaults to one per scenario, capped at the CPU count).
+    :param pin_cpus: Pin each scenario's worker to its own CPU (round-robin over the CPUs this process
+                     may run on), so the OS does not migrate it between cores. A pinned scenario's
+                     worker threads share that one CPU. Ignored where os.sched_setaffinity is not
+                     available (e.g. macOS, Windows).
+    :return: The exploits found by all scenarios, in scenario order, without repeats of the same
+             'input_symbol'.
+    """
+    if not scenario_calls:
+        return []
+    if workers is None:
+        workers = min(len(scenario_calls), os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        cpus: List[Optional[int]] = [None]
+        if pin_cpus and hasattr(os, "sched_setaffinity"):
+            cpus = sorted(os.sched_getaffinity(0))
+        futures = [
+            executor.submit(_run_scenario, scenario_fn, kwargs, cpus[i % len(cpus)])
+            for i, (scenario_fn, kwargs) in enumerate(scenario_calls)
+        ]
+
+        merged_exploits: List[Dict[str, Any]] = []
+        seen_input_symbols = set()
+        for scenario_call, future in zip(scenario_calls, futures): # In scenario order, so the output is deterministic
+            try:
+                found_exploits = future.result()
+            except Exception as e:
+                print(f"WARN: Scenario {scenario_call[0].__name__} failed in its worker: {e}")
+                continue
+            for exploit in found_exploits:
+                if exploit['input_symbol'] in seen_input_symbols:
+                    continue
+                seen_input_symbols.add(exploit['input_symbol'])
+                merged_exploits.append(exploit)
+    return merged_exploits
+
+if __name__ == "__main__":
+    logging.basicConfig(level=core_config.LOG_LEVEL, format="%(levelname)s: %(message)s")
+    # To run: python -m scenarios.parallel_runner [--affinity] <rpc_url> [<rpc_url> ...]
+    # Runs the mpfuzz scenario once against each given node.
+    args = sys.argv[1:]
+    pin_cpus = "--affinity" in args
+    rpc_urls = [arg for arg in args if arg != "--affinity"]
+    if not rpc_urls:
+        print("Usage: python -m scenarios.parallel_runner [--affinity] <rpc_url> [<rpc_url> ...]")
+        sys.exit(1)
+
+    exploits = run_scenarios_parallel([(run_mpfuzz_scenario, {"rpc_url": rpc_url}) for rpc_url in rpc_urls],
+                                      pin_cpus=pin_cpus)
+    print(f"\n--- Parallel Run: {len(exploits)} distinct exploit(s) ---")
+    for exploit in exploits:
+        print(f"  {exploit['input_symbol']} -> {exploit['end_state_symbol']}")
@@ -0,0 +1,16 @@
+import os
+import pytest
+from hypothesis import settings
+
+# Hypothesis example budgets; select one with HYPOTHESIS_PROFILE (defaults to "dev").
+# Failing examples are saved to .hypothesis/, so keeping that directory between CI runs
+# replays them before any new examples are generated.
+settings.register_profile("dev", max_examples=10)
+settings.register_profile("ci", max_examples=25)
+settings.register_profile("nightly", max_examples=500)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Makes the engine's settle-time sleeps return immediately."""
+    monkeypatch.setattr("eth_txpool_fuzzer_core.fuzz_engine.time.sleep", lambda *args, **kwargs: None)
@@ -0,0 +1,31 @@
+import pytest
+from unittest.mock import Mock
+from eth_txpool_fuzzer_core.accounts import AccountManager
+from eth_txpool_fuzzer_core.clients.base_client import IEthereumClient
+
+@pytest.fixture
+def mock_account_manager():
+    """Fixture for a mocked AccountManager."""
+    mock_am = Mock(spec=AccountManager)
+    mock_am.get_account_by_index.side_effect = lambda i: f"0xAccount{i}"
+    mock_am.get_fuzzer_nonce.return_value = 0
+    mock_am.increment_fuzzer_nonce.return_value = None
+    return mock_am
+
+@pytest.fixture
+def mock_ethereum_client():
+    """Fixture for a mocked IEthereumClient."""
+    mock_ec = Mock(spec=IEthereumClient)
+    mock_ec.get_current_gas_prices.return_value = {
+        'maxFeePerGas': 100,
+        'maxPriorityFeePerGas': 10,
+        'gasPrice': 50, # For legacy transactions, though we're focusing on EIP-1559
+        'maxFeePerBlobGas': 1
+    }
+    mock_ec.sign_and_send_transfer.return_value = "0xmockhash"
+    # Route batch submissions through sign_and_send_transfer so tests can inspect individual sends
+    mock_ec.sign_and_send_transfer_batch.side_effect = lambda txs, private_keys: [
+        mock_ec.sign_and_send_transfer(tx, private_key) for tx, private_key in zip(txs, private_keys)
+    ]
+    mock_ec.get_txpool_content.return_value = {} # Empty pool for most tests
+    return mock_ec
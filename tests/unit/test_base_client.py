@@ -0,0 +1,70 @@
+from unittest.mock import patch
+from eth_txpool_fuzzer_core.clients.anvil_client import AnvilClient
+from eth_txpool_fuzzer_core.tx import FuzzTx
+
+class TestEthereumClientGasPrices:
+    def test_gas_prices_are_cached_until_revert(self):
+        """
+        Test that the client re-uses a gas price fetch and drops it when the chain is reverted.
+        """
+        client = AnvilClient("http://127.0.0.1:8545", manage_lifecycle=False)
+        with patch.object(client, '_fetch_current_gas_prices', return_value={'maxFeePerGas': 100}) as mock_fetch, \
+             patch.object(client, 'call_custom_rpc'):
+            assert client.get_current_gas_prices() == {'maxFeePerGas': 100}
+            assert client.get_current_gas_prices() == {'maxFeePerGas': 100}
+            assert mock_fetch.call_count == 1
+            client.revert("0x1")
+            client.get_current_gas_prices()
+            assert mock_fetch.call_count == 2
+
+
+class TestSignAndSendTransferBatch:
+    @staticmethod
+    def _make_txs(count):
+        return [FuzzTx(account_manager_index=i, sender_address=f"0xAccount{i}", nonce=0, price=10, value=1)
+                for i in range(count)]
+
+    def test_batch_hashes_line_up_with_inputs(self):
+        """
+        Test that per-entry results and errors, and a tx that fails to sign, map back to the
+        position of their tx in the input list.
+        """
+        client = AnvilClient("http://127.0.0.1:8545", manage_lifecycle=False)
+        txs = self._make_txs(4)
+        sign_results = [b"\x01", ValueError("bad key"), b"\x03", b"\x04"]
+        responses = [
+            {'jsonrpc': '2.0', 'id': 0, 'result': "0xhash0"},
+            {'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32000, 'message': "nonce too low"}},
+            {'jsonrpc': '2.0', 'id': 2, 'result': "0xhash3"},
+        ]
+        with patch.object(client, '_sign_transaction', side_effect=sign_results), \
+             patch.object(client.get_web3_instance().provider, 'make_batch_request', return_value=responses) as mock_batch:
+            tx_hashes = client.sign_and_send_transfer_batch(txs, ["0xkey"] * 4)
+
+        assert tx_hashes == ["0xhash0", None, None, "0xhash3"]
+        # The tx that failed to sign is left out of the batch
+        assert mock_batch.call_args.args[0] == [
+            ("eth_sendRawTransaction", ["0x01"]),
+            ("eth_sendRawTransaction", ["0x03"]),
+            ("eth_sendRawTransaction", ["0x04"]),
+        ]
+
+    def test_whole_batch_error_returns_no_hashes(self):
+        """
+        Test that a single error response for the whole batch yields None for every tx.
+        """
+        client = AnvilClient("http://127.0.0.1:8545", manage_lifecycle=False)
+        batch_error = {'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': "batch too large"}}
+        with patch.object(client, '_sign_transaction', return_value=b"\x01"), \
+             patch.object(client.get_web3_instance().provider, 'make_batch_request', return_value=batch_error):
+            assert client.sign_and_send_transfer_batch(self._make_txs(2), ["0xkey"] * 2) == [None, None]
+
+    def test_no_request_when_nothing_signs(self):
+        """
+        Test that no batch request is made when every tx fails to sign.
+        """
+        client = AnvilClient("http://127.0.0.1:8545", manage_lifecycle=False)
+        with patch.object(client, '_sign_transaction', side_effect=ValueError("bad key")), \
+             patch.object(client.get_web3_instance().provider, 'make_batch_request') as mock_batch:
+            assert client.sign_and_send_transfer_batch(self._make_txs(2), ["0xkey"] * 2) == [None, None]
+        mock_batch.assert_not_called()
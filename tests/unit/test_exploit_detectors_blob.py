@@ -0,0 +1,18 @@
+from eth_txpool_fuzzer_core.exploit_detectors_blob import FusedBlobExploitCondition
+
+class TestFusedBlobExploitCondition:
+    def test_reports_each_condition_met(self):
+        """
+        Test that one check reports every blob-scenario condition the pool meets, and nothing for a
+        pool of normal txs.
+        """
+        condition = FusedBlobExploitCondition(txpool_size=4, low_price_threshold=1)
+        invalid_low_price_blob_tx = {'type': '0x3', 'value': '0x0', 'gasPrice': '0x5', 'maxFeePerGas': '0x5',
+                                     'maxFeePerBlobGas': '0x1'}
+        assert condition.check_condition({'pending': {'0xA1': {'0': invalid_low_price_blob_tx}}, 'queued': {}})
+        assert condition.last_triggered == ("LowCostStateExploit", "BlobGasPriceManipulationExploit",
+                                            "InvalidBlobTxAcceptanceExploit")
+
+        normal_tx = {'type': '0x0', 'value': '0x0', 'gasPrice': '0x3'}
+        assert not condition.check_condition({'pending': {'0xA1': {'0': normal_tx}}, 'queued': {}})
+        assert condition.last_triggered == ()
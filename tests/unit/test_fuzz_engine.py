@@ -1,36 +1,12 @@
 import pytest
 from unittest.mock import Mock, patch
-from eth_txpool_fuzzer_core.fuzz_engine import FuzzEngine
+from eth_txpool_fuzzer_core.fuzz_engine import FuzzEngine, Seed, SeedDatabase
 from eth_txpool_fuzzer_core.tx import FuzzInput, FuzzTx
 from eth_txpool_fuzzer_core.accounts import AccountManager
-from eth_txpool_fuzzer_core.client_comms import EthereumClient
+from eth_txpool_fuzzer_core.clients.base_client import IEthereumClient
 from eth_txpool_fuzzer_core.mutation import MutationStrategy
 from eth_txpool_fuzzer_core.exploit_detectors import ExploitCondition
-from hypothesis import given, strategies as st, settings, HealthCheck
-
-@pytest.fixture
-def mock_account_manager():
-    """Fixture for a mocked AccountManager."""
-    mock_am = Mock(spec=AccountManager)
-    mock_am.get_account_by_index.side_effect = lambda i: f"0xAccount{i}"
-    mock_am.get_fuzzer_nonce.return_value = 0
-    mock_am.increment_fuzzer_nonce.return_value = None
-    return mock_am
-
-@pytest.fixture
-def mock_ethereum_client():
-    """Fixture for a mocked EthereumClient."""
-    mock_ec = Mock(spec=EthereumClient)
-    mock_ec.clear_txpool_custom.return_value = True
-    mock_ec.get_current_gas_prices.return_value = {
-        'maxFeePerGas': 100,
-        'maxPriorityFeePerGas': 10,
-        'gasPrice': 50, # For legacy transactions, though we're focusing on EIP-1559
-        'maxFeePerBlobGas': 1
-    }
-    mock_ec.sign_and_send_transfer.return_value = "0xmockhash"
-    mock_ec.get_txpool_content.return_value = {} # Empty pool for most tests
-    return mock_ec
+from hypothesis import example, given, strategies as st, settings, HealthCheck
 
 @pytest.fixture
 def mock_mutation_strategy():
@@ -92,28 +68,32 @@ class TestFuzzEngine:
 
         mock_account_manager.get_account_by_index.assert_called_with(account_index)
 
-    def test_generate_future_tx_account_out_of_bounds(self, fuzz_engine, mock_account_manager, capsys):
+    @pytest.mark.parametrize("method_name, tx_kind, args", [
+        ("_generate_future_tx", "future tx", ({'maxFeePerGas': 100, 'maxPriorityFeePerGas': 10, 'gasPrice': 50, 'maxFeePerBlobGas': 1},)),
+        ("_generate_parent_tx", "parent tx", (100,)),
+    ], ids=["future", "parent"])
+    def test_generate_tx_account_out_of_bounds(self, fuzz_engine, mock_account_manager, caplog, method_name, tx_kind, args):
         """
-        Test _generate_future_tx when the provided account index is out of bounds,
-        it should fall back to account 0 and log a warning.
+        Test _generate_future_tx and _generate_parent_tx when the provided account index is out of bounds,
+        they should fall back to account 0 and log a warning.
         """
         mock_account_manager.get_account_by_index.side_effect = [None, "0xAccount0"] # First call returns None, second returns 0xAccount0
-        gas_prices = {'maxFeePerGas': 100, 'maxPriorityFeePerGas': 10, 'gasPrice': 50, 'maxFeePerBlobGas': 1}
 
-        future_tx = fuzz_engine._generate_future_tx(999, gas_prices) # Use an out-of-bounds index
+        tx = getattr(fuzz_engine, method_name)(999, *args) # Use an out-of-bounds index
 
-        assert isinstance(future_tx, FuzzTx)
-        assert future_tx.sender_address == "0xAccount0" # Should fall back to account 0
+        assert isinstance(tx, FuzzTx)
+        assert tx.sender_address == "0xAccount0" # Should fall back to account 0
         mock_account_manager.get_account_by_index.assert_any_call(999)
         mock_account_manager.get_account_by_index.assert_any_call(0)
 
-        captured = capsys.readouterr()
-        assert "WARN: Fuzzer account index 999 out of bounds. Using account 0 for future tx." in captured.out
+        assert f"Fuzzer account index 999 out of bounds. Using account 0 for {tx_kind}." in caplog.text
 
     @given(
         price=st.integers(min_value=1, max_value=1000),
         account_index=st.integers(min_value=0, max_value=5)
     )
+    @example(price=1, account_index=0) # Always cover both ends of the price range, whatever the profile's budget
+    @example(price=1000, account_index=5)
     @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
     def test_generate_parent_tx(self, fuzz_engine, mock_account_manager, price, account_index):
         """
@@ -137,25 +117,7 @@ class TestFuzzEngine:
         mock_account_manager.get_account_by_index.assert_called_with(account_index)
         mock_account_manager.get_fuzzer_nonce.assert_called_with(f"0xAccount{account_index}")
 
-    def test_generate_parent_tx_account_out_of_bounds(self, fuzz_engine, mock_account_manager, capsys):
-        """
-        Test _generate_parent_tx when the provided account index is out of bounds,
-        it should fall back to account 0 and log a warning.
-        """
-        mock_account_manager.get_account_by_index.side_effect = [None, "0xAccount0"]
-        mock_account_manager.get_fuzzer_nonce.return_value = 0 # Default nonce for fallback account
-
-        parent_tx = fuzz_engine._generate_parent_tx(999, 100) # Use an out-of-bounds index
-
-        assert isinstance(parent_tx, FuzzTx)
-        assert parent_tx.sender_address == "0xAccount0"
-        mock_account_manager.get_account_by_index.assert_any_call(999)
-        mock_account_manager.get_account_by_index.assert_any_call(0)
-
-        captured = capsys.readouterr()
-        assert "WARN: Fuzzer account index 999 out of bounds. Using account 0 for parent tx." in captured.out
-
-    def test_generate_parent_tx_nonce_none(self, fuzz_engine, mock_account_manager, capsys):
+    def test_generate_parent_tx_nonce_none(self, fuzz_engine, mock_account_manager, caplog):
         """
         Test _generate_parent_tx when get_fuzzer_nonce returns None,
         it should fall back to nonce 0 and log a warning.
@@ -168,8 +130,7 @@ class TestFuzzEngine:
         assert isinstance(parent_tx, FuzzTx)
         assert parent_tx.nonce == 0 # Should fall back to nonce 0
 
-        captured = capsys.readouterr()
-        assert "WARN: Could not get fuzzer nonce for 0xAccount0. Using 0." in captured.out
+        assert "Could not get fuzzer nonce for 0xAccount0. Using 0." in caplog.text
 
     def test_fuzz_tx_sender_address_not_none_after_fallback(self, fuzz_engine, mock_account_manager):
         """
@@ -191,8 +152,7 @@ class TestFuzzEngine:
         mock_account_manager.get_account_by_index.assert_any_call(100)
         mock_account_manager.get_account_by_index.assert_any_call(0)
 
-    @patch('eth_txpool_fuzzer_core.fuzz_engine.time.sleep', return_value=None)
-    def test_reset_and_initial_pool_setup_success(self, mock_sleep, fuzz_engine, mock_ethereum_client, mock_account_manager):
+    def test_reset_and_initial_pool_setup_success(self, fuzz_engine, mock_ethereum_client, mock_account_manager):
         """
         Test _reset_and_initial_pool_setup for successful clearing and initial transaction sending.
         """
@@ -201,14 +161,13 @@ class TestFuzzEngine:
 
         fuzz_engine._reset_and_initial_pool_setup()
 
-        mock_ethereum_client.clear_txpool_custom.assert_called_once()
+        mock_ethereum_client.reset_state.assert_called_once()
         mock_account_manager.reset_all_fuzzer_nonces.assert_called_once()
         mock_ethereum_client.get_current_gas_prices.assert_called_once()
         assert mock_ethereum_client.sign_and_send_transfer.call_count == 2 # Two initial normal txs
         assert mock_account_manager.increment_fuzzer_nonce.call_count == 2
 
-    @patch('eth_txpool_fuzzer_core.fuzz_engine.time.sleep', return_value=None)
-    def test_reset_and_initial_pool_setup_future_tx_enabled(self, mock_sleep, fuzz_engine, mock_ethereum_client, mock_account_manager):
+    def test_reset_and_initial_pool_setup_future_tx_enabled(self, fuzz_engine, mock_ethereum_client, mock_account_manager):
         """
         Test _reset_and_initial_pool_setup when future transactions are enabled.
         """
@@ -221,7 +180,7 @@ class TestFuzzEngine:
         with patch.object(fuzz_engine, '_generate_future_tx', return_value=Mock(spec=FuzzTx, sender_address="0xFutureSender", nonce=10000)) as mock_gen_future_tx:
             fuzz_engine._reset_and_initial_pool_setup()
 
-            mock_ethereum_client.clear_txpool_custom.assert_called_once()
+            mock_ethereum_client.reset_state.assert_called_once()
             mock_account_manager.reset_all_fuzzer_nonces.assert_called_once()
             mock_ethereum_client.get_current_gas_prices.assert_called_once()
             assert mock_ethereum_client.sign_and_send_transfer.call_count == 2 # 1 normal + 1 future
@@ -229,8 +188,7 @@ class TestFuzzEngine:
             mock_gen_future_tx.assert_called_once()
             assert fuzz_engine.current_fuzzer_account_index == 1 # Should increment for future tx
 
-    @patch('eth_txpool_fuzzer_core.fuzz_engine.time.sleep', return_value=None)
-    def test_reset_and_initial_pool_setup_gas_price_fetch_failure(self, mock_sleep, fuzz_engine, mock_ethereum_client, capsys):
+    def test_reset_and_initial_pool_setup_gas_price_fetch_failure(self, fuzz_engine, mock_ethereum_client, caplog):
         """
         Test _reset_and_initial_pool_setup when gas price fetching fails,
         it should use default values and log a warning.
@@ -241,22 +199,64 @@ class TestFuzzEngine:
 
         fuzz_engine._reset_and_initial_pool_setup()
 
-        captured = capsys.readouterr()
-        assert "ERROR: Could not fetch current gas prices. Using default values for initial setup." in captured.out
+        assert "Could not fetch current gas prices. Using default values for initial setup." in caplog.text
         # Verify that sign_and_send_transfer was still called, implying default values were used
         mock_ethereum_client.sign_and_send_transfer.assert_called_once()
         # Check that the sent tx used default EIP-1559 values (from core_config, not mocked here, but implied)
         # For a more robust test, we'd inspect the call args of sign_and_send_transfer.
         # For now, just checking it was called is sufficient.
 
-    @patch('eth_txpool_fuzzer_core.fuzz_engine.time.sleep', return_value=None)
-    def test_execute_input_sequence_initial_setup(self, mock_sleep, fuzz_engine, mock_ethereum_client, mock_account_manager):
+    def test_reset_and_initial_pool_setup_fetches_gas_prices_after_each_reset(self, fuzz_engine, mock_ethereum_client):
+        """
+        Test that every reset asks the client for gas prices (which the client re-fetches after
+        reset_state), instead of re-using prices from before the reset.
+        """
+        fuzz_engine.initial_normal_tx_count = 1
+        fuzz_engine.txpool_size = 1
+
+        fuzz_engine._reset_and_initial_pool_setup()
+        mock_ethereum_client.get_current_gas_prices.return_value = {
+            'maxFeePerGas': 300, 'maxPriorityFeePerGas': 30, 'gasPrice': 200, 'maxFeePerBlobGas': 1
+        }
+        fuzz_engine._reset_and_initial_pool_setup()
+
+        assert mock_ethereum_client.get_current_gas_prices.call_count == 2
+        assert mock_ethereum_client.sign_and_send_transfer.call_args_list[-1].args[0].price == 300 # maxFeePerGas
+
+    def test_send_transfers_keeps_input_order(self, fuzz_engine, mock_ethereum_client):
+        """
+        Test that an input sequence (ordered, the default) is sent one tx per request in sequence order,
+        since a node may process the entries of one batch in any order.
+        """
+        txs = [
+            FuzzTx(account_manager_index=0, sender_address="0xAccount0", nonce=0, price=10, value=1),
+            FuzzTx(account_manager_index=1, sender_address="0xAccount1", nonce=0, price=20, value=1),
+            FuzzTx(account_manager_index=0, sender_address="0xAccount0", nonce=0, price=30, value=1), # Replacement
+        ]
+
+        assert fuzz_engine._send_transfers(txs) == ["0xmockhash"] * 3
+        assert [call.args[0] for call in mock_ethereum_client.sign_and_send_transfer_batch.call_args_list] == [[tx] for tx in txs]
+
+    def test_send_transfers_unordered_batches_until_replacement(self, fuzz_engine, mock_ethereum_client):
+        """
+        Test that unordered txs share one batch, and that a replacement of a tx in the batch starts a new one.
+        """
+        txs = [
+            FuzzTx(account_manager_index=0, sender_address="0xAccount0", nonce=0, price=10, value=1),
+            FuzzTx(account_manager_index=1, sender_address="0xAccount1", nonce=0, price=20, value=1),
+            FuzzTx(account_manager_index=0, sender_address="0xAccount0", nonce=0, price=30, value=1), # Replacement
+        ]
+
+        fuzz_engine._send_transfers(txs, ordered=False)
+        assert [call.args[0] for call in mock_ethereum_client.sign_and_send_transfer_batch.call_args_list] == [txs[:2], txs[2:]]
+
+    def test_execute_input_sequence_initial_setup(self, fuzz_engine, mock_ethereum_client, mock_account_manager):
         """
         Test _execute_input_sequence when initial_pool_state_to_recreate is None,
         triggering _reset_and_initial_pool_setup and then sending input_to_execute.
         """
-        input_tx1 = Mock(spec=FuzzTx, sender_address="0xAccount0", nonce=0, tx_type=0)
-        input_tx2 = Mock(spec=FuzzTx, sender_address="0xAccount1", nonce=0, tx_type=0)
+        input_tx1 = FuzzTx(account_manager_index=0, sender_address="0xAccount0", nonce=0, price=0, value=0)
+        input_tx2 = FuzzTx(account_manager_index=1, sender_address="0xAccount1", nonce=0, price=0, value=0)
         test_input = FuzzInput(tx_sequence_to_execute=[input_tx1, input_tx2])
 
         # Patch _reset_and_initial_pool_setup to prevent actual reset during this test
@@ -271,19 +271,18 @@ class TestFuzzEngine:
             assert mock_ethereum_client.sign_and_send_transfer.call_args_list[0][0][0] == input_tx1
             assert mock_ethereum_client.sign_and_send_transfer.call_args_list[1][0][0] == input_tx2
 
-    @patch('eth_txpool_fuzzer_core.fuzz_engine.time.sleep', return_value=None)
     @patch('eth_txpool_fuzzer_core.fuzz_engine.get_symbolic_pool_state', return_value="N") # Mock symbolic state for recreation
-    def test_execute_input_sequence_recreate_state(self, mock_get_symbolic_pool_state, mock_sleep, fuzz_engine, mock_ethereum_client, mock_account_manager):
+    def test_execute_input_sequence_recreate_state(self, mock_get_symbolic_pool_state, fuzz_engine, mock_ethereum_client, mock_account_manager):
         """
         Test _execute_input_sequence when recreating a previous state.
         """
         initial_pool_state = {"pending": {}, "queued": {}}
         base_input = FuzzInput(tx_sequence_to_execute=[
-            Mock(spec=FuzzTx, sender_address="0xAccount0", nonce=0, tx_type=0),
-            Mock(spec=FuzzTx, sender_address="0xAccount1", nonce=0, tx_type=0)
+            FuzzTx(account_manager_index=0, sender_address="0xAccount0", nonce=0, price=0, value=0),
+            FuzzTx(account_manager_index=1, sender_address="0xAccount1", nonce=0, price=0, value=0)
         ], base_input_indices_to_resend=[0]) # Simulate one tx to resend
 
-        input_tx_new = Mock(spec=FuzzTx, sender_address="0xAccount2", nonce=0, tx_type=0)
+        input_tx_new = FuzzTx(account_manager_index=2, sender_address="0xAccount2", nonce=0, price=0, value=0)
         test_input = FuzzInput(tx_sequence_to_execute=[input_tx_new])
 
         fuzz_engine.txpool_size = 1 # For normal tx recreation count
@@ -295,24 +294,160 @@ class TestFuzzEngine:
             base_input_for_recreation=base_input
         )
 
-        mock_ethereum_client.clear_txpool_custom.assert_called_once()
+        mock_ethereum_client.reset_state.assert_called_once()
         mock_account_manager.reset_all_fuzzer_nonces.assert_called_once()
         mock_ethereum_client.get_current_gas_prices.assert_called_once()
 
         # Expected calls: 1 normal tx recreation + 1 base_input_to_resend + 1 new input tx
         # The exact order and number of calls to sign_and_send_transfer can be tricky due to internal logic.
         # Let's check for specific calls.
+        sent_txs = [call.args[0] for call in mock_ethereum_client.sign_and_send_transfer.call_args_list]
         # Check for the normal tx recreation
-        assert any(call.args[0].sender_address == "0xAccount0" and call.args[0].value == 1 for call in mock_ethereum_client.sign_and_send_transfer.call_args_list)
+        assert any(tx.sender_address == "0xAccount0" and tx.value == 1 for tx in sent_txs)
         # Check for the base_input_to_resend tx
-        assert any(call.args[0] == base_input.tx_sequence_to_execute[0] for call in mock_ethereum_client.sign_and_send_transfer.call_args_list)
+        assert base_input.tx_sequence_to_execute[0] in sent_txs
         # Check for the new input tx
-        assert any(call.args[0] == input_tx_new for call in mock_ethereum_client.sign_and_send_transfer.call_args_list)
+        assert input_tx_new in sent_txs
 
         # Ensure nonce is incremented for the new input tx (if not future tx)
         if input_tx_new.nonce != 10000:
             mock_account_manager.increment_fuzzer_nonce.assert_called_with(input_tx_new.sender_address)
 
+    def test_checkpoint_and_restore_base_state(self, fuzz_engine, mock_ethereum_client, mock_account_manager):
+        """
+        Test that a seed's base state is recreated once and snapshotted, that restoring the checkpoint
+        reverts the client and the fuzzer bookkeeping, and that a revert which does not restore the
+        txpool disables snapshots.
+        """
+        base_pool = {"pending": {"0xAccount0": {"0": {}}}, "queued": {}}
+        seed = Seed(FuzzInput(tx_sequence_to_execute=[]), base_pool, symbolic_state_str="N", energy=1)
+        mock_ethereum_client.snapshot.side_effect = ["0x1", "0x2"]
+        mock_ethereum_client.get_txpool_content.return_value = base_pool
+        mock_account_manager.snapshot_fuzzer_nonces.return_value = {"0xAccount0": 1}
+        fuzz_engine.txpool_size = 1
+
+        checkpoint = fuzz_engine._checkpoint_base_state(seed)
+        assert checkpoint["snapshot_id"] == "0x1"
+        mock_ethereum_client.reset_state.assert_called_once()
+
+        fuzz_engine.current_fuzzer_account_index = 7
+        assert fuzz_engine._restore_base_checkpoint(checkpoint)
+        mock_ethereum_client.revert.assert_called_once_with("0x1")
+        mock_account_manager.restore_fuzzer_nonces.assert_called_once_with({"0xAccount0": 1})
+        assert fuzz_engine.current_fuzzer_account_index == 0
+        assert checkpoint["snapshot_id"] == "0x2" # Re-snapshotted for the next input
+
+        mock_ethereum_client.snapshot.side_effect = None
+        mock_ethereum_client.get_txpool_content.return_value = {"pending": {}, "queued": {}}
+        assert not fuzz_engine._restore_base_checkpoint(checkpoint)
+        assert fuzz_engine._checkpoint_base_state(seed) is None
+
+    def test_execute_inputs_from_initial_seed_builds_base_state_once(self, fuzz_engine, mock_ethereum_client):
+        """
+        Test that inputs mutated from the initial seed share one reset-and-setup, and that only
+        the inputs after the first revert to the snapshot.
+        """
+        seed = Seed(FuzzInput(tx_sequence_to_execute=[]), None, symbolic_state_str="<INITIAL_STATE>", energy=0)
+        inputs = [FuzzInput(tx_sequence_to_execute=[]) for _ in range(3)]
+        mock_ethereum_client.snapshot.return_value = "0x1"
+
+        results = fuzz_engine._execute_inputs_from_seed(seed, inputs)
+
+        assert [pool for _, pool in results] == [{}, {}, {}]
+        mock_ethereum_client.reset_state.assert_called_once()
+        assert mock_ethereum_client.revert.call_count == 2
+
+    def test_execute_mutated_inputs_across_worker_clients(self, mock_account_manager, mock_ethereum_client, mock_mutation_strategy, mock_exploit_condition):
+        """
+        Test that mutated inputs are split into contiguous chunks across the main and worker clients,
+        and that results come back in input order.
+        """
+        worker_client = Mock(spec=IEthereumClient)
+        engine = FuzzEngine(
+            account_manager=mock_account_manager,
+            ethereum_client=mock_ethereum_client,
+            mutation_strategy=mock_mutation_strategy,
+            exploit_condition=mock_exploit_condition,
+            default_recipient_address="0xDefaultRecipient",
+            worker_clients=[worker_client]
+        )
+        seed = Seed(FuzzInput(tx_sequence_to_execute=[]), None)
+        inputs = [
+            FuzzInput(tx_sequence_to_execute=[FuzzTx(account_manager_index=i, sender_address=f"0xAccount{i}", nonce=0, price=10, value=1)])
+            for i in range(3)
+        ]
+        executed_on = {}
+
+        def execute_input_sequence(engine_client, input_to_execute, **kwargs):
+            executed_on[input_to_execute.tx_sequence_to_execute[0].account_manager_index] = engine_client
+            return {"pending": {}, "queued": {}, "index": input_to_execute.tx_sequence_to_execute[0].account_manager_index}
+
+        with patch.object(FuzzEngine, '_checkpoint_base_state', return_value=None), \
+             patch.object(FuzzEngine, '_execute_input_sequence', autospec=True,
+                          side_effect=lambda self, **kwargs: execute_input_sequence(self.client, **kwargs)):
+            results = engine._execute_mutated_inputs(seed, inputs)
+
+        assert [new_input for new_input, _ in results] == inputs
+        assert [pool["index"] for _, pool in results] == [0, 1, 2]
+        assert executed_on == {0: mock_ethereum_client, 1: mock_ethereum_client, 2: worker_client}
+        assert engine.current_fuzzer_account_index == 3
+
+    def test_execute_mutated_inputs_keeps_nonces_of_last_input(self, mock_ethereum_client, mock_mutation_strategy, mock_exploit_condition):
+        """
+        Test that after a parallel run with more inputs than clients, the main engine's fuzzer nonces
+        are those left by the last input (run on a worker), as after a serial run.
+        """
+        account_manager = AccountManager(key_file_paths=[])
+        account_manager.restore_fuzzer_nonces({f"0xAccount{i}": 0 for i in range(3)})
+        engine = FuzzEngine(
+            account_manager=account_manager,
+            ethereum_client=mock_ethereum_client,
+            mutation_strategy=mock_mutation_strategy,
+            exploit_condition=mock_exploit_condition,
+            default_recipient_address="0xDefaultRecipient",
+            worker_clients=[Mock(spec=IEthereumClient)]
+        )
+        seed = Seed(FuzzInput(tx_sequence_to_execute=[]), None)
+        inputs = [
+            FuzzInput(tx_sequence_to_execute=[FuzzTx(account_manager_index=i, sender_address=f"0xAccount{i}", nonce=0, price=10, value=1)])
+            for i in range(3)
+        ]
+
+        def execute_input_sequence(engine, input_to_execute, **kwargs):
+            # Each input rebuilds the base state (resetting nonces), then sends its txs
+            engine.account_manager.reset_all_fuzzer_nonces(0)
+            for tx in input_to_execute.tx_sequence_to_execute:
+                engine.account_manager.increment_fuzzer_nonce(tx.sender_address)
+            return {"pending": {}, "queued": {}}
+
+        with patch.object(FuzzEngine, '_checkpoint_base_state', return_value=None), \
+             patch.object(FuzzEngine, '_execute_input_sequence', autospec=True, side_effect=execute_input_sequence):
+            engine._execute_mutated_inputs(seed, inputs) # Inputs 0-1 on the main client, input 2 on the worker
+
+        assert account_manager.snapshot_fuzzer_nonces() == {"0xAccount0": 0, "0xAccount1": 0, "0xAccount2": 1}
+        assert engine.current_fuzzer_account_index == 3
+
+    @pytest.mark.parametrize("parent_exploit_found, expected_child_seeds", [(False, 0), (True, 1)], ids=["plain", "exploit"])
+    def test_run_fuzzing_skips_children_with_unchanged_pool(self, fuzz_engine, mock_mutation_strategy, parent_exploit_found, expected_child_seeds):
+        """
+        Test that a mutated input leaving the parent's pool unchanged adds no child seed, unless the
+        parent seed was itself an exploit.
+        """
+        parent_pool = {"pending": {}, "queued": {}}
+        parent_seed = Seed(FuzzInput(tx_sequence_to_execute=[]), parent_pool, symbolic_state_str="EEEE", energy=0)
+        parent_seed.exploit_found = parent_exploit_found
+        new_input = FuzzInput(tx_sequence_to_execute=[])
+        mock_mutation_strategy.mutate.return_value = [new_input]
+        fuzz_engine.max_iterations = 1
+
+        with patch.object(fuzz_engine.seed_db, 'get_next_seed', return_value=parent_seed), \
+             patch.object(fuzz_engine, '_execute_mutated_inputs', return_value=[(new_input, {"pending": {}, "queued": {}})]), \
+             patch.object(fuzz_engine.seed_db, 'add_seed', wraps=fuzz_engine.seed_db.add_seed) as mock_add_seed:
+            fuzz_engine.run_fuzzing()
+
+        child_seeds = [call.args[0] for call in mock_add_seed.call_args_list if call.args[0].fuzz_input is new_input]
+        assert len(child_seeds) == expected_child_seeds
+
     def test_parse_input_to_symbol(self, fuzz_engine):
         """
         Test _parse_input_to_symbol for various transaction types.
@@ -353,3 +488,69 @@ class TestFuzzEngine:
             "from: 0xSender2, to: 0xDefaultRecipient, nonce: 1, price: 20, value: 200"
         ]
         assert concrete_strings == expected_strings
+
+
+class TestSeedDatabase:
+    def test_get_next_seed_orders_by_energy_then_generation(self):
+        """
+        Test that seeds are served lowest energy first, and that a served seed is queued
+        behind seeds with the same energy once its generation is bumped.
+        """
+        seed_db = SeedDatabase()
+        seed_a = Seed(FuzzInput(tx_sequence_to_execute=[]), {}, symbolic_state_str="A", energy=5)
+        seed_b = Seed(FuzzInput(tx_sequence_to_execute=[]), {}, symbolic_state_str="B", energy=5)
+        seed_c = Seed(FuzzInput(tx_sequence_to_execute=[]), {}, symbolic_state_str="C", energy=7)
+        for seed in (seed_c, seed_a, seed_b):
+            seed_db.add_seed(seed)
+        seed_db.add_seed(Seed(FuzzInput(tx_sequence_to_execute=[]), {}, symbolic_state_str="A", energy=0)) # Duplicate state
+
+        assert seed_db.count == 3
+        assert [seed_db.get_next_seed() for _ in range(4)] == [seed_a, seed_b, seed_a, seed_b]
+        assert (seed_a.generation, seed_b.generation, seed_c.generation) == (2, 2, 0)
+
+    def test_get_next_seed_demotes_after_max_consecutive_mutations(self):
+        """
+        Test that a seed served MAX_CONSECUTIVE_MUTATIONS times ranks behind higher-energy seeds.
+        """
+        seed_db = SeedDatabase()
+        seed_low = Seed(FuzzInput(tx_sequence_to_execute=[]), {}, symbolic_state_str="L", energy=0)
+        seed_high = Seed(FuzzInput(tx_sequence_to_execute=[]), {}, symbolic_state_str="H", energy=9)
+        seed_db.add_seed(seed_low)
+        seed_db.add_seed(seed_high)
+
+        with patch('eth_txpool_fuzzer_core.fuzz_engine.core_config.MAX_CONSECUTIVE_MUTATIONS', 2):
+            assert [seed_db.get_next_seed() for _ in range(4)] == [seed_low, seed_low, seed_high, seed_high]
+        assert seed_low.demoted and seed_high.demoted
+
+    def test_evict_older_than_drops_stale_mutated_seeds(self):
+        """
+        Test that only seeds which were mutated and then left idle are evicted, and that
+        their states stay known.
+        """
+        seed_db = SeedDatabase()
+        seed_stale = Seed(FuzzInput(tx_sequence_to_execute=[]), {}, symbolic_state_str="S", energy=1, generation=1)
+        seed_fresh = Seed(FuzzInput(tx_sequence_to_execute=[]), {}, symbolic_state_str="F", energy=2, generation=1)
+        seed_unmutated = Seed(FuzzInput(tx_sequence_to_execute=[]), {}, symbolic_state_str="U", energy=3)
+        for seed in (seed_stale, seed_fresh, seed_unmutated):
+            seed_db.add_seed(seed)
+        seed_stale.last_selected_time -= 120
+        seed_unmutated.last_selected_time -= 120
+
+        assert seed_db.evict_older_than(60) == 1
+        assert seed_db.count == 2
+        assert seed_db.get_next_seed() is seed_fresh
+        assert seed_db.covers("S")
+
+    def test_seeds_without_symbolic_state_are_ordered_lazily(self):
+        """
+        Test that seeds without a symbolic state are appended unordered and still served by energy.
+        """
+        seed_db = SeedDatabase()
+        seeds = [Seed(FuzzInput(tx_sequence_to_execute=[]), {}, energy=energy) for energy in (9, 3, 6)]
+        for seed in seeds:
+            seed_db.add_seed(seed)
+        seed_db.add_seed(Seed(FuzzInput(tx_sequence_to_execute=[]), {}, symbolic_state_str="K", energy=1))
+
+        assert seed_db.count == 4
+        assert seed_db.get_next_seed().energy == 1
+        assert all(not seed_db.seeds[i] < seed_db.seeds[(i - 1) // 2] for i in range(1, 4)) # Valid heap
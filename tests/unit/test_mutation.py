@@ -0,0 +1,45 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+from eth_txpool_fuzzer_core.tx import FuzzInput
+from eth_txpool_fuzzer_core.mutation import MutationStrategy, CompositeMutationStrategy
+
+class TestCompositeMutationStrategy:
+    def test_mutate_collects_sub_strategy_results_in_order(self, mock_account_manager, mock_ethereum_client):
+        """
+        Test that without an executor the sub-strategies run serially, share one gas price fetch, and that
+        their inputs are concatenated in strategy order.
+        """
+        inputs = [FuzzInput(tx_sequence_to_execute=[]) for _ in range(3)]
+        strategies = [Mock(spec=MutationStrategy, ethereum_client=mock_ethereum_client) for _ in range(2)]
+        strategies[0].mutate.return_value = inputs[:2]
+        strategies[1].mutate.return_value = inputs[2:]
+        composite = CompositeMutationStrategy(mock_account_manager, mock_ethereum_client, strategies)
+        assert composite._executor is None # No implicit thread pool to leak
+        base_input = FuzzInput(tx_sequence_to_execute=[])
+
+        assert composite.mutate(base_input, {}, 5) == inputs
+        gas_prices = mock_ethereum_client.get_current_gas_prices.return_value
+        mock_ethereum_client.get_current_gas_prices.assert_called_once()
+        for strategy in strategies:
+            strategy.mutate.assert_called_once_with(base_input, {}, 5, gas_prices=gas_prices)
+
+    def test_mutate_uses_injected_executor(self, mock_account_manager, mock_ethereum_client):
+        """
+        Test that a caller-supplied executor is used for the sub-strategies, even for a single strategy.
+        """
+        strategy = Mock(spec=MutationStrategy, ethereum_client=mock_ethereum_client)
+        strategy.mutate.return_value = [FuzzInput(tx_sequence_to_execute=[])]
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            executor = Mock(wraps=pool)
+            composite = CompositeMutationStrategy(mock_account_manager, mock_ethereum_client, [strategy], executor=executor)
+
+            assert composite.mutate(FuzzInput(tx_sequence_to_execute=[]), {}, 5) == strategy.mutate.return_value
+        executor.submit.assert_called_once()
+
+    def test_rejects_sub_strategy_without_client(self, mock_account_manager, mock_ethereum_client):
+        """
+        Test that a sub-strategy built without an ethereum_client is rejected at construction.
+        """
+        with pytest.raises(ValueError, match="ethereum_client"):
+            CompositeMutationStrategy(mock_account_manager, mock_ethereum_client, [Mock(spec=MutationStrategy)])
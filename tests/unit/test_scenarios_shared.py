@@ -0,0 +1,82 @@
+import pytest
+from unittest.mock import Mock, patch
+from scenarios import _shared
+from scenarios._shared import cached_scenario, get_account_manager
+
+class TestCachedScenario:
+    def test_result_cache_hit_miss_and_expiry(self, tmp_path, capsys, monkeypatch):
+        """
+        Test that a miss runs the scenario, a hit returns (and reports) the stored exploits without
+        running it, and an expired entry or a new chain head runs it again.
+        """
+        exploits = [{'input_symbol': "PR", 'input_concrete': [], 'end_state_symbol': "EEPR",
+                     'seed_generation': 1, 'time_found': 0.5}]
+        scenario_body = Mock(return_value=exploits)
+
+        @cached_scenario
+        def run_test_scenario(rpc_url: str = "http://node", txpool_size: int = 4):
+            return scenario_body(rpc_url, txpool_size)
+
+        cache_path = str(tmp_path / "results")
+        eth_client = Mock()
+        eth_client.w3.eth.block_number = 100
+        with patch.object(_shared, 'get_eth_client', return_value=eth_client):
+            assert run_test_scenario(result_cache_path=cache_path) == exploits # Miss
+            assert scenario_body.call_count == 1
+            capsys.readouterr()
+
+            assert run_test_scenario(result_cache_path=cache_path) == exploits # Hit
+            assert scenario_body.call_count == 1
+            assert "Found 1 exploit(s)" in capsys.readouterr().out
+
+            run_test_scenario(txpool_size=8, result_cache_path=cache_path) # Other arguments miss
+            assert scenario_body.call_count == 2
+
+            eth_client.w3.eth.block_number = 101
+            run_test_scenario(result_cache_path=cache_path) # A new chain head misses
+            assert scenario_body.call_count == 3
+
+            monkeypatch.setattr(_shared, 'SCENARIO_RESULT_CACHE_TTL_SECONDS', 0.0)
+            run_test_scenario(result_cache_path=cache_path) # Expired
+            assert scenario_body.call_count == 4
+
+        run_test_scenario() # Without a cache path the scenario always runs
+        assert scenario_body.call_count == 5
+
+    def test_failed_setup_is_not_cached(self, tmp_path):
+        """
+        Test that a scenario whose setup failed (returned None) is run again rather than served
+        from the cache as an empty campaign.
+        """
+        scenario_body = Mock(return_value=None)
+
+        @cached_scenario
+        def run_test_scenario(rpc_url: str = "http://node"):
+            return scenario_body(rpc_url)
+
+        cache_path = str(tmp_path / "results")
+        eth_client = Mock()
+        eth_client.w3.eth.block_number = 100
+        with patch.object(_shared, 'get_eth_client', return_value=eth_client):
+            assert run_test_scenario(result_cache_path=cache_path) is None
+            scenario_body.return_value = []
+            assert run_test_scenario(result_cache_path=cache_path) == []
+            assert scenario_body.call_count == 2
+
+
+class TestGetAccountManager:
+    def test_empty_account_manager_is_not_cached(self):
+        """
+        Test that a load with no accounts raises and is retried on the next call, while a
+        successful load is cached.
+        """
+        get_account_manager.cache_clear()
+        empty_manager = Mock(loaded_account_count=0)
+        loaded_manager = Mock(loaded_account_count=2)
+        with patch.object(_shared, 'AccountManager', side_effect=[empty_manager, loaded_manager]) as mock_account_manager:
+            with pytest.raises(ValueError, match="No accounts loaded"):
+                get_account_manager("primary.csv", "secondary.csv", 10)
+            assert get_account_manager("primary.csv", "secondary.csv", 10) is loaded_manager
+            assert get_account_manager("primary.csv", "secondary.csv", 10) is loaded_manager
+            assert mock_account_manager.call_count == 2
+        get_account_manager.cache_clear()